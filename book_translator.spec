@@ -62,6 +62,7 @@ a = Analysis(
         'book_translator.utils.text_processing',
         'book_translator.utils.validators',
         'book_translator.utils.logging',
+        'book_translator.utils.serialization',
         'book_translator.services',
         'book_translator.services.ollama_client',
         'book_translator.services.cache_service',
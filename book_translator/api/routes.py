@@ -4,19 +4,29 @@ API Routes
 Flask blueprints for all API endpoints.
 """
 
+import io
 import json
 import os
 import threading
 import time
 import uuid
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import asdict
 from datetime import datetime as dt
 from html import escape
 from pathlib import Path
-
-from flask import Blueprint, Response, jsonify, request, send_file
+from typing import Dict, Optional, Tuple
+
+import psutil
+from flask import (
+    Blueprint,
+    Response,
+    jsonify,
+    request,
+    send_file,
+    stream_with_context,
+)
 from werkzeug.utils import secure_filename
 
 from book_translator.api.middleware import rate_limit
@@ -27,6 +37,7 @@ from book_translator.services.cache_service import get_cache
 from book_translator.services.ollama_client import get_ollama_client
 from book_translator.services.translator import BookTranslator
 from book_translator.utils.logging import get_logger
+from book_translator.utils.serialization import json_dumps
 from book_translator.utils.text_processing import clean_for_epub
 from book_translator.utils.validators import (
     validate_file,
@@ -36,10 +47,46 @@ from book_translator.utils.validators import (
 
 # Global thread pool for translation tasks (limits concurrent translations)
 _translation_executor = None
+_progress_writer = None
 _translation_tasks = {}
 _translation_cancel_events = {}
 _translation_lock = threading.Lock()
 
+# Disk usage changes slowly; /metrics reuses a path's statvfs sample this long
+DISK_USAGE_CACHE_SECONDS = 30
+_disk_usage_samples: Dict[str, Tuple[float, float]] = {}
+
+# Static part of every exported EPUB; only the package and chapter documents
+# depend on the request
+EPUB_CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+    <rootfiles>
+        <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+    </rootfiles>
+</container>"""
+
+
+def _get_disk_percent(path: str) -> Optional[float]:
+    """
+    Disk usage of `path`, sampled at most once per DISK_USAGE_CACHE_SECONDS.
+
+    Args:
+        path: Any path on the disk to inspect
+
+    Returns:
+        Percentage of the disk in use, or None if it could not be read.
+        Failed reads are not cached, so the next call tries again.
+    """
+    sample = _disk_usage_samples.get(path)
+    if sample and time.monotonic() - sample[0] < DISK_USAGE_CACHE_SECONDS:
+        return sample[1]
+    try:
+        percent = psutil.disk_usage(path).percent
+    except Exception:
+        return None
+    _disk_usage_samples[path] = (time.monotonic(), percent)
+    return percent
+
 
 def get_translation_executor() -> ThreadPoolExecutor:
     """Get or create the translation thread pool."""
@@ -52,6 +99,27 @@ def get_translation_executor() -> ThreadPoolExecutor:
     return _translation_executor
 
 
+def get_progress_writer() -> ThreadPoolExecutor:
+    """Get or create the single thread that persists translation progress."""
+    global _progress_writer
+    if _progress_writer is None:
+        _progress_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="progress-writer"
+        )
+    return _progress_writer
+
+
+def _save_progress(repo, translation_id: int, progress) -> None:
+    """Write a progress update; runs on the progress writer thread."""
+    repo.update_progress(
+        translation_id,
+        progress.progress,
+        progress.stage,
+        progress.machine_translation,
+        progress.translated_text,
+    )
+
+
 def _register_translation_task(
     translation_id: int, future, cancel_event: threading.Event
 ) -> None:
@@ -105,7 +173,17 @@ def _submit_translation_job(
     translator = BookTranslator(model_name=model_name)
     cancel_event = threading.Event()
 
+    last_write = None
+
+    def wait_for_progress_writes():
+        # The writer is a single thread, so once the last submitted write
+        # has run every earlier one has too. Its outcome is not checked
+        # here; callers are about to stop or record a terminal status.
+        if last_write is not None:
+            wait([last_write])
+
     def run_translation():
+        nonlocal last_write
         try:
             start_time = time.time()
             final_result = None
@@ -113,6 +191,17 @@ def _submit_translation_job(
             if cancel_event.is_set():
                 return
 
+            # A full update rewrites the whole accumulated text, so when updates
+            # arrive in quick succession (cache hits) only the latest text is
+            # written once per flush interval; the updates in between save just
+            # progress and stage. Writes (and joining the texts they store) run
+            # on the progress writer thread, so the loop goes straight back to
+            # the next chunk and only waits for them before stopping or
+            # recording a final status.
+            flush_interval = config.translation.progress_flush_interval
+            last_flush = 0.0
+            unsaved = None
+
             for progress in translator.translate_text(
                 content,
                 source_lang,
@@ -125,26 +214,40 @@ def _submit_translation_job(
                     logger.info(
                         f"Translation {translation_id} cancellation acknowledged"
                     )
+                    wait_for_progress_writes()
                     return
 
-                translation = repo.get_by_id(translation_id)
-                if (
-                    not translation
-                    or translation["status"] == TranslationStatus.CANCELLED.value
-                ):
+                status = repo.get_status(translation_id)
+                if status is None or status == TranslationStatus.CANCELLED.value:
                     logger.info(
                         f"Translation {translation_id} stopped before progress update"
                     )
+                    wait_for_progress_writes()
                     return
 
-                repo.update_progress(
-                    translation_id,
-                    progress.progress,
-                    progress.stage,
-                    progress.machine_translation,
-                    progress.translated_text,
-                )
                 final_result = progress
+                unsaved = progress
+                if time.monotonic() - last_flush < flush_interval:
+                    last_write = get_progress_writer().submit(
+                        repo.update_progress,
+                        translation_id,
+                        progress.progress,
+                        progress.stage,
+                    )
+                    continue
+
+                last_write = get_progress_writer().submit(
+                    _save_progress, repo, translation_id, progress
+                )
+                last_flush = time.monotonic()
+                unsaved = None
+
+            if unsaved is not None:
+                last_write = get_progress_writer().submit(
+                    _save_progress, repo, translation_id, unsaved
+                )
+            if last_write is not None:
+                last_write.result()
 
             translation = repo.get_by_id(translation_id)
             if (
@@ -174,6 +277,8 @@ def _submit_translation_job(
 
         except Exception as e:
             logger.error(f"Translation {translation_id} failed: {e}")
+            # A progress write still queued would otherwise land after this
+            wait_for_progress_writes()
             repo.mark_failed(translation_id, str(e))
         finally:
             _unregister_translation_task(translation_id)
@@ -228,19 +333,18 @@ def create_translation_blueprint() -> Blueprint:
             if not model_validation[0]:  # is_valid
                 return jsonify({"error": model_validation[1]}), 400  # error_message
 
-            # Save file
+            # Decode the upload in memory; nothing downstream needs it on disk
             filename = secure_filename(file.filename)
-            upload_path = config.paths.upload_folder / filename
-            file.save(str(upload_path))
+            raw = file.stream.read()
 
             # Read content with encoding detection
             try:
-                content = upload_path.read_text(encoding="utf-8")
+                content = raw.decode("utf-8")
             except UnicodeDecodeError:
                 # Try other common encodings
                 for encoding in ["latin-1", "cp1252", "iso-8859-1"]:
                     try:
-                        content = upload_path.read_text(encoding=encoding)
+                        content = raw.decode(encoding)
                         logger.warning(
                             f"File {filename} decoded with {encoding} (not UTF-8)"
                         )
@@ -256,8 +360,7 @@ def create_translation_blueprint() -> Blueprint:
                         ),
                         400,
                     )
-            file_size = upload_path.stat().st_size
-            upload_path.unlink(missing_ok=True)
+            file_size = len(raw)
 
             # Create translation record
             repo = get_translation_repository()
@@ -319,29 +422,33 @@ def create_translation_blueprint() -> Blueprint:
         """Stream translation progress via SSE."""
         repo = get_translation_repository()
 
+        def event(payload: dict) -> bytes:
+            return b"data: " + json_dumps(payload) + b"\n\n"
+
         def generate():
             last_progress = -1
             while True:
                 translation = repo.get_by_id(translation_id)
 
                 if not translation:
-                    yield f"data: {json.dumps({'error': 'Translation not found'})}\n\n"
+                    yield event({"error": "Translation not found"})
                     break
 
                 current_progress = translation["progress"]
 
                 if current_progress != last_progress:
-                    payload = {
-                        "id": translation["id"],
-                        "status": translation["status"],
-                        "progress": translation["progress"],
-                        "stage": translation["stage"],
-                        "machine_translation": translation.get(
-                            "machine_translation", ""
-                        ),
-                        "translated_text": translation.get("translated_text", ""),
-                    }
-                    yield f"data: {json.dumps(payload)}\n\n"
+                    yield event(
+                        {
+                            "id": translation["id"],
+                            "status": translation["status"],
+                            "progress": translation["progress"],
+                            "stage": translation["stage"],
+                            "machine_translation": translation.get(
+                                "machine_translation", ""
+                            ),
+                            "translated_text": translation.get("translated_text", ""),
+                        }
+                    )
                     last_progress = current_progress
 
                 if translation["status"] in ["completed", "failed", "cancelled"]:
@@ -349,8 +456,10 @@ def create_translation_blueprint() -> Blueprint:
 
                 time.sleep(1)
 
+        # Keep the app context open while streaming so the database connection
+        # is released by teardown once the stream ends
         return Response(
-            generate(),
+            stream_with_context(generate()),
             mimetype="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -420,13 +529,33 @@ def create_translation_blueprint() -> Blueprint:
     def list_translations():
         """List all translations."""
         status = request.args.get("status")
-        limit = int(request.args.get("limit", 100))
-        offset = int(request.args.get("offset", 0))
+        try:
+            limit = int(request.args.get("limit", 100))
+            offset = int(request.args.get("offset", 0))
+        except ValueError:
+            return jsonify({"error": "limit and offset must be integers"}), 400
+        if limit < 0 or offset < 0:
+            return jsonify({"error": "limit and offset must not be negative"}), 400
 
         repo = get_translation_repository()
-        translations = repo.get_all(status=status, limit=limit, offset=offset)
+        rows = repo.iter_all(status=status, limit=limit, offset=offset)
+        # Run the query before the 200 is sent so that database errors
+        # still produce a proper error response
+        first = next(rows, None)
+
+        # Rows carry full book texts, so encode them one at a time rather
+        # than building the whole history in memory. A failure after this
+        # point cuts the body short, leaving invalid JSON for the client.
+        def generate():
+            yield b'{"translations":['
+            if first is not None:
+                yield json_dumps(first)
+                for row in rows:
+                    yield b","
+                    yield json_dumps(row)
+            yield b"]}"
 
-        return jsonify({"translations": translations})
+        return Response(stream_with_context(generate()), mimetype="application/json")
 
     @bp.route("/translations/stats", methods=["GET"])
     def get_stats():
@@ -489,13 +618,15 @@ def create_health_blueprint() -> Blueprint:
             }
         )
 
+    # Prime psutil's CPU counters so get_metrics can read usage since the
+    # previous call instead of blocking for a sampling interval
+    psutil.cpu_percent(interval=None)
+
     @bp.route("/metrics", methods=["GET"])
     def get_metrics():
         """Get application metrics."""
         import time
 
-        import psutil
-
         repo = get_translation_repository()
         stats = repo.get_stats()
         by_status = stats.get("by_status", {})
@@ -515,15 +646,10 @@ def create_health_blueprint() -> Blueprint:
         else:
             disk_path = "/"
 
-        try:
-            disk_percent = psutil.disk_usage(disk_path).percent
-        except Exception:
-            disk_percent = 0.0
-
         system_metrics = {
-            "cpu_percent": psutil.cpu_percent(interval=1),
+            "cpu_percent": psutil.cpu_percent(interval=None),
             "memory_percent": psutil.virtual_memory().percent,
-            "disk_usage": disk_percent,
+            "disk_usage": _get_disk_percent(disk_path),
             "uptime": time.time() - psutil.boot_time(),
         }
 
@@ -606,27 +732,22 @@ def create_files_blueprint() -> Blueprint:
             return jsonify({"error": "No text provided"}), 400
 
         epub_id = str(uuid.uuid4())
-        epub_filename = f"translation_{epub_id}.epub"
-        epub_path = config.paths.translations_folder / epub_filename
 
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-        html_paragraphs = "".join(f"<p>{escape(p)}</p>\n" for p in paragraphs)
+        paragraphs = (p.strip() for p in text.split("\n\n"))
+        html_paragraphs = "".join(f"<p>{escape(p)}</p>\n" for p in paragraphs if p)
         safe_title = escape(title)
         safe_author = escape(author)
 
-        with zipfile.ZipFile(epub_path, "w", zipfile.ZIP_DEFLATED) as epub:
+        # Built in memory and compressed once at the highest level; the
+        # package is never needed on disk
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(
+            buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=9
+        ) as epub:
             epub.writestr(
                 "mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED
             )
-            epub.writestr(
-                "META-INF/container.xml",
-                """<?xml version="1.0" encoding="UTF-8"?>
-<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
-    <rootfiles>
-        <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
-    </rootfiles>
-</container>""",
-            )
+            epub.writestr("META-INF/container.xml", EPUB_CONTAINER_XML)
             epub.writestr(
                 "OEBPS/content.opf",
                 f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -686,8 +807,9 @@ def create_files_blueprint() -> Blueprint:
 </html>""",
             )
 
+        buffer.seek(0)
         return send_file(
-            str(epub_path),
+            buffer,
             as_attachment=True,
             download_name=f"{Path(title).stem or 'translation'}.epub",
             mimetype="application/epub+zip",
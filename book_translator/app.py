@@ -18,7 +18,7 @@ from book_translator.api.routes import (
     create_translation_blueprint,
 )
 from book_translator.config import config
-from book_translator.database.connection import get_database
+from book_translator.database.connection import get_database, release_connection
 from book_translator.utils.logging import debug_print, get_logger
 
 
@@ -67,6 +67,11 @@ def create_app(testing: bool = False) -> Flask:
     # Add middleware
     app.after_request(add_rate_limit_headers)
 
+    # Hand request threads' database connections back for reuse
+    @app.teardown_appcontext
+    def release_db_connection(exc):
+        release_connection()
+
     # Error handlers
     @app.errorhandler(400)
     def bad_request(e):
@@ -137,6 +137,23 @@ class OllamaConfig:
     health_check_timeout: int = field(
         default_factory=lambda: _get_int_env("OLLAMA_HEALTH_TIMEOUT", 5)
     )
+    # Seconds a health probe result is reused before /api/tags is hit again
+    # (0 probes on every call).
+    health_cache_seconds: float = field(
+        default_factory=lambda: _get_float_env("OLLAMA_HEALTH_CACHE_SECONDS", 10.0)
+    )
+    # Seconds a fetched model list is reused before /api/tags is hit again
+    # (0 fetches on every call).
+    models_cache_seconds: float = field(
+        default_factory=lambda: _get_float_env("OLLAMA_MODELS_CACHE_SECONDS", 5.0)
+    )
+
+    # Upper bound on generate requests in flight at once across every
+    # translation job. Raise it together with Ollama's OLLAMA_NUM_PARALLEL;
+    # requests beyond what the server runs in parallel just queue there.
+    max_concurrent_requests: int = field(
+        default_factory=lambda: _get_int_env("OLLAMA_MAX_CONCURRENT_REQUESTS", 2)
+    )
 
     # Generation parameters
     temperature: float = field(
@@ -183,10 +200,17 @@ class TranslationConfig:
         default_factory=lambda: _get_float_env("RETRY_DELAY", 2.0)
     )
 
-    # Sleep between chunks (0 to disable). Gives Ollama a breather between
-    # requests instead of firing the next one immediately.
+    # Sleep between chunks (0 to disable). Local Ollama has no rate limit,
+    # so this is off by default; failed requests (including 429s from a
+    # remote endpoint) already back off by `retry_delay` per attempt.
     chunk_delay: float = field(
-        default_factory=lambda: _get_float_env("CHUNK_DELAY", 1.5)
+        default_factory=lambda: _get_float_env("CHUNK_DELAY", 0.0)
+    )
+
+    # Minimum seconds between progress writes to the database. Updates that
+    # arrive faster are coalesced; the latest one is always saved at the end.
+    progress_flush_interval: float = field(
+        default_factory=lambda: _get_float_env("PROGRESS_FLUSH_INTERVAL", 1.0)
     )
 
     # Parallel processing
@@ -219,6 +243,22 @@ class CacheConfig:
         default_factory=lambda: _get_int_env("CACHE_MAX_AGE_DAYS", 30)
     )
 
+    # Cache stores are handed to a background writer that commits them in
+    # batches of up to `write_batch_size` rows, or whatever has queued up
+    # after `write_batch_interval_ms`, whichever comes first.
+    write_batch_size: int = field(
+        default_factory=lambda: _get_int_env("CACHE_WRITE_BATCH_SIZE", 50)
+    )
+    write_batch_interval_ms: int = field(
+        default_factory=lambda: _get_int_env("CACHE_WRITE_BATCH_INTERVAL_MS", 200)
+    )
+
+    # Number of recent lookups kept in an in-process LRU in front of SQLite
+    # (0 disables it).
+    memory_entries: int = field(
+        default_factory=lambda: _get_int_env("CACHE_MEMORY_ENTRIES", 4096)
+    )
+
 
 @dataclass
 class FileConfig:
@@ -6,6 +6,7 @@ Handles SQLite database connections with proper context management.
 
 import sqlite3
 import threading
+from collections import deque
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
@@ -13,6 +14,25 @@ from typing import Generator, Optional
 from book_translator.config import config
 from book_translator.utils.logging import debug_print, get_logger
 
+# Connection tuning shared by every SQLite database the app opens (the
+# translations DB and the translation cache). WAL lets readers run while a
+# writer appends, and synchronous=NORMAL is still crash-safe under WAL
+# without paying for an fsync on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the shared performance PRAGMAs to a freshly opened connection."""
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 
 class Database:
     """
@@ -24,12 +44,21 @@ class Database:
     _instance: Optional["Database"] = None
     _lock = threading.Lock()
 
+    # Idle connections kept for reuse by later threads
+    MAX_IDLE_CONNECTIONS = 8
+
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or Path(config.paths.db_path)
         self.logger = get_logger().db_logger
         self._local = threading.local()
         self._initialized = False
 
+        # The threaded dev server runs every request on a new thread, so a
+        # purely thread-local connection would be opened (and configured)
+        # per request. Threads hand theirs back via release() instead.
+        self._idle: deque = deque()
+        self._idle_lock = threading.Lock()
+
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -45,18 +74,39 @@ class Database:
     def connection(self) -> sqlite3.Connection:
         """Get thread-local connection."""
         if not hasattr(self._local, "connection") or self._local.connection is None:
-            self._local.connection = self._create_connection()
+            with self._idle_lock:
+                conn = self._idle.pop() if self._idle else None
+            self._local.connection = conn or self._create_connection()
         return self._local.connection
 
+    def release(self) -> None:
+        """Return the calling thread's connection to the idle pool."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            return
+        self._local.connection = None
+
+        if conn.in_transaction:
+            conn.rollback()
+        with self._idle_lock:
+            if len(self._idle) < self.MAX_IDLE_CONNECTIONS:
+                self._idle.append(conn)
+                return
+        conn.close()
+
     def _create_connection(self) -> sqlite3.Connection:
         """Create a new database connection."""
-        conn = sqlite3.connect(str(self.db_path), timeout=config.security.db_timeout)
+        # Pooled connections move between threads, but only ever serve one
+        # thread at a time
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=config.security.db_timeout,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
 
         # Enable WAL mode for better concurrency
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=10000")
+        configure_connection(conn)
         conn.execute("PRAGMA foreign_keys=ON")
 
         return conn
@@ -142,11 +192,13 @@ class Database:
     def _create_indexes(self) -> None:
         """Create database indexes for performance."""
         with self.connection:
-            # Translations indexes
+            # Translations indexes; status lookups and the status-filtered
+            # history list (newest first) share one index
+            self.connection.execute("DROP INDEX IF EXISTS idx_translations_status")
             self.connection.execute(
                 """
-                CREATE INDEX IF NOT EXISTS idx_translations_status 
-                ON translations(status)
+                CREATE INDEX IF NOT EXISTS idx_translations_status_created_at 
+                ON translations(status, created_at DESC)
             """
             )
             self.connection.execute(
@@ -211,10 +263,13 @@ class Database:
         return cursor.fetchall()
 
     def close(self) -> None:
-        """Close thread-local connection."""
+        """Close thread-local connection and any idle pooled connections."""
         if hasattr(self._local, "connection") and self._local.connection:
             self._local.connection.close()
             self._local.connection = None
+        with self._idle_lock:
+            while self._idle:
+                self._idle.pop().close()
 
     def vacuum(self) -> None:
         """Optimize database by running VACUUM."""
@@ -235,6 +290,12 @@ def get_database() -> Database:
     return _database
 
 
+def release_connection() -> None:
+    """Return the calling thread's connection to the pool, if one is open."""
+    if _database is not None:
+        _database.release()
+
+
 def reset_database() -> None:
     """Reset database singleton (for testing)."""
     global _database
@@ -5,12 +5,19 @@ Data access patterns for translation entities.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from book_translator.config.constants import TranslationStatus
 from book_translator.database.connection import Database, get_database
 from book_translator.utils.logging import get_logger
 
+# Statuses a translation never leaves once set
+_TERMINAL_STATUSES = (
+    TranslationStatus.COMPLETED.value,
+    TranslationStatus.FAILED.value,
+    TranslationStatus.CANCELLED.value,
+)
+
 
 class TranslationRepository:
     """
@@ -66,12 +73,25 @@ class TranslationRepository:
         )
         return dict(row) if row else None
 
+    def get_status(self, translation_id: int) -> Optional[str]:
+        """Get only the status of a translation, without loading its texts."""
+        row = self.db.fetchone(
+            "SELECT status FROM translations WHERE id = ?", (translation_id,)
+        )
+        return row["status"] if row else None
+
     def get_all(
         self, status: str = None, limit: int = 100, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Get all translations with optional filtering."""
+        return list(self.iter_all(status=status, limit=limit, offset=offset))
+
+    def iter_all(
+        self, status: str = None, limit: int = 100, offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield translations one row at a time with optional filtering."""
         if status:
-            rows = self.db.fetchall(
+            cursor = self.db.execute(
                 """
                 SELECT * FROM translations 
                 WHERE status = ?
@@ -81,7 +101,7 @@ class TranslationRepository:
                 (status, limit, offset),
             )
         else:
-            rows = self.db.fetchall(
+            cursor = self.db.execute(
                 """
                 SELECT * FROM translations 
                 ORDER BY created_at DESC
@@ -90,7 +110,8 @@ class TranslationRepository:
                 (limit, offset),
             )
 
-        return [dict(row) for row in rows]
+        for row in cursor:
+            yield dict(row)
 
     def update_progress(
         self,
@@ -100,7 +121,12 @@ class TranslationRepository:
         machine_translation: str = None,
         translated_text: str = None,
     ) -> None:
-        """Update translation progress."""
+        """
+        Update translation progress.
+
+        Progress writes are persisted asynchronously, so one can land after
+        the job already reached a terminal status; those rows are left alone.
+        """
         with self.db.transaction() as conn:
             if translated_text:
                 conn.execute(
@@ -113,7 +139,7 @@ class TranslationRepository:
                         translated_text = ?,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
-                      AND status != ?
+                      AND status NOT IN (?, ?, ?)
                 """,
                     (
                         progress,
@@ -122,7 +148,7 @@ class TranslationRepository:
                         machine_translation,
                         translated_text,
                         translation_id,
-                        TranslationStatus.CANCELLED.value,
+                        *_TERMINAL_STATUSES,
                     ),
                 )
             elif machine_translation:
@@ -135,7 +161,7 @@ class TranslationRepository:
                         machine_translation = ?,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
-                      AND status != ?
+                      AND status NOT IN (?, ?, ?)
                 """,
                     (
                         progress,
@@ -143,7 +169,7 @@ class TranslationRepository:
                         TranslationStatus.PROCESSING.value,
                         machine_translation,
                         translation_id,
-                        TranslationStatus.CANCELLED.value,
+                        *_TERMINAL_STATUSES,
                     ),
                 )
             else:
@@ -155,14 +181,14 @@ class TranslationRepository:
                         status = ?,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
-                      AND status != ?
+                      AND status NOT IN (?, ?, ?)
                 """,
                     (
                         progress,
                         stage,
                         TranslationStatus.PROCESSING.value,
                         translation_id,
-                        TranslationStatus.CANCELLED.value,
+                        *_TERMINAL_STATUSES,
                     ),
                 )
 
@@ -6,7 +6,8 @@ Core data structures for translations.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Sequence
 
 from book_translator.config.constants import TranslationStatus
 
@@ -86,17 +87,33 @@ class TranslationResult:
 
 @dataclass
 class TranslationProgress:
-    """Progress update during translation."""
+    """
+    Progress update during translation.
+
+    The machine and final translations are kept as per-chunk pieces and only
+    joined when read, so emitting an update per chunk doesn't copy the whole
+    accumulated text each time.
+    """
 
     progress: float
     stage: str
     original_text: str = ""
-    machine_translation: str = ""
-    translated_text: str = ""
+    machine_chunks: Sequence[str] = ()
+    translated_chunks: Sequence[str] = ()
     current_chunk: int = 0
     total_chunks: int = 0
     error: Optional[str] = None
 
+    @cached_property
+    def machine_translation(self) -> str:
+        """Machine (stage 1) translation of the chunks done so far."""
+        return "\n\n".join(self.machine_chunks)
+
+    @cached_property
+    def translated_text(self) -> str:
+        """Final (stage 2) translation of the chunks done so far."""
+        return "\n\n".join(self.translated_chunks)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for SSE events."""
         result = {
@@ -4,14 +4,55 @@ Translation Cache Service
 Caching layer for translations to avoid repeated API calls.
 """
 
+import atexit
 import hashlib
+import queue
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from book_translator.config import config
+from book_translator.database.connection import configure_connection
 from book_translator.utils.logging import debug_print, get_logger
 
+# Hot-path statements. Kept as constants so every call passes the exact same
+# SQL text, letting sqlite3's per-connection statement cache reuse the
+# compiled statement instead of re-parsing it.
+SELECT_SQL = """
+    SELECT translated_text, machine_translation
+    FROM translation_cache
+    WHERE hash_key = ?
+"""
+
+INSERT_SQL = """
+    INSERT OR REPLACE INTO translation_cache
+    (hash_key, source_lang, target_lang, original_text, translated_text,
+     machine_translation, model, created_at, last_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+"""
+
+UPDATE_USED_SQL = """
+    UPDATE translation_cache
+    SET last_used = CURRENT_TIMESTAMP
+    WHERE hash_key = ?
+"""
+
+# Queued by close() to end the background writer's loop
+_STOP_WRITER = None
+
+
+@lru_cache(maxsize=256)
+def _hash_key(
+    text: str, source_lang: str, target_lang: str, model: str, context_hash: str
+) -> str:
+    """Digest a translation request into its cache key."""
+    key = f"{text}:{source_lang}:{target_lang}:{model}:{context_hash}".encode("utf-8")
+    return hashlib.sha256(key).hexdigest()
+
 
 class TranslationCache:
     """Cache for storing and retrieving translations."""
@@ -19,33 +60,179 @@ class TranslationCache:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or config.paths.cache_db_path
         self.logger = get_logger().app_logger
+        self._local = threading.local()
         self._init_db()
 
+        # Stores are queued and committed in batches by a background writer
+        # so the translation loop never waits on a commit. Rows that are
+        # queued but not yet written stay visible to get() via _pending.
+        self._pending: Dict[str, Tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._write_queue: "queue.Queue[Tuple]" = queue.Queue()
+        self._writer_conn = configure_connection(
+            sqlite3.connect(self.db_path, check_same_thread=False)
+        )
+        self._writer_thread = threading.Thread(
+            target=self._writer, name="cache-writer", daemon=True
+        )
+        self._writer_thread.start()
+        # The writer is a daemon thread, so drain the queue on interpreter
+        # exit rather than losing the stores still waiting in it
+        atexit.register(self.flush)
+
+        # Recently used results, so repeat lookups of the same chunk (retries,
+        # retranslations) are a dict hit instead of an index probe.
+        self._memory: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the thread-local cache connection, opening it on first use."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = configure_connection(
+                sqlite3.connect(self.db_path, check_same_thread=False)
+            )
+            self._local.connection = conn
+        return conn
+
+    def close(self) -> None:
+        """
+        Commit queued stores, stop the background writer and close the
+        writer's and the calling thread's connections.
+
+        The cache must not be used for stores after it is closed.
+        """
+        if self._writer_thread.is_alive():
+            self.flush()
+            self._write_queue.put(_STOP_WRITER)
+            self._writer_thread.join()
+            self._writer_conn.close()
+            atexit.unregister(self.flush)
+
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+    def _writer(self) -> None:
+        """Background loop that drains the write queue in batches."""
+        batch_size = max(1, config.cache.write_batch_size)
+        interval = max(0, config.cache.write_batch_interval_ms) / 1000
+
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._write_queue.get()
+            deadline = time.monotonic() + interval
+            while True:
+                if item is _STOP_WRITER:
+                    stopping = True
+                    self._write_queue.task_done()
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple]) -> None:
+        """Commit a batch of queued rows and hit touches in one transaction."""
+        # Stores are full rows; a hit only queues its (hash_key,) for a
+        # last_used bump
+        rows = [item for item in batch if len(item) > 1]
+        touched = [item for item in batch if len(item) == 1]
+        try:
+            with self._writer_conn as conn:
+                if rows:
+                    conn.executemany(INSERT_SQL, rows)
+                if touched:
+                    conn.executemany(UPDATE_USED_SQL, touched)
+            debug_print(
+                f"  [STORED] Committed {len(rows)} cache rows, {len(touched)} hits",
+                "DEBUG",
+                "CACHE",
+            )
+        except sqlite3.Error as e:
+            debug_print(f"  [ERROR] Cache store failed: {e}", "ERROR", "CACHE")
+            self.logger.error(f"Cache store error: {e}")
+        finally:
+            with self._pending_lock:
+                for row in rows:
+                    # Only drop the entry if it wasn't overwritten meanwhile
+                    if self._pending.get(row[0]) is row:
+                        del self._pending[row[0]]
+
+    def _remember(self, hash_key: str, result: Dict[str, str]) -> None:
+        """Insert a result into the in-memory LRU, evicting the oldest entry."""
+        max_entries = config.cache.memory_entries
+        if max_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[hash_key] = result
+            self._memory.move_to_end(hash_key)
+            while len(self._memory) > max_entries:
+                self._memory.popitem(last=False)
+
+    def _forget_all(self) -> None:
+        """Drop every entry from the in-memory LRU."""
+        with self._memory_lock:
+            self._memory.clear()
+
+    def flush(self) -> None:
+        """Block until every queued cache store has been committed."""
+        # Nothing drains the queue once close() has stopped the writer
+        if self._writer_thread.is_alive():
+            self._write_queue.join()
+
     def _init_db(self):
         """Initialize the cache database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS translation_cache (
-                    hash_key TEXT PRIMARY KEY,
-                    source_lang TEXT,
-                    target_lang TEXT,
-                    original_text TEXT,
-                    translated_text TEXT,
-                    machine_translation TEXT,
-                    model TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        conn = self.connection
+        # Incremental auto-vacuum lets cleanup hand freed pages back to the
+        # filesystem instead of the file only ever growing. This takes effect
+        # on a new file; existing files switch over on their next clear().
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
+        with conn:
+            self._create_schema(conn)
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the cache table and its indexes if they don't exist."""
+        conn.execute(
             """
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                hash_key TEXT PRIMARY KEY,
+                source_lang TEXT,
+                target_lang TEXT,
+                original_text TEXT,
+                translated_text TEXT,
+                machine_translation TEXT,
+                model TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-            # Create indexes for faster lookups
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_cache_hash ON translation_cache(hash_key)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_cache_lookup ON translation_cache(hash_key, last_used)"
-            )
+        """
+        )
+        # The primary key's own index already serves hash_key lookups; these
+        # two only duplicated it and cost every store and touch a write
+        conn.execute("DROP INDEX IF EXISTS idx_cache_hash")
+        conn.execute("DROP INDEX IF EXISTS idx_cache_lookup")
+        # cleanup() and get_stats() filter on last_used
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_last_used "
+            "ON translation_cache(last_used)"
+        )
 
     def _generate_hash(
         self,
@@ -56,10 +243,11 @@ class TranslationCache:
         context_hash: str = "",
     ) -> str:
         """Generate a unique hash for a translation request."""
-        key = f"{text}:{source_lang}:{target_lang}:{model}:{context_hash}".encode(
-            "utf-8"
-        )
-        return hashlib.sha256(key).hexdigest()
+        # Each chunk is looked up and then stored with the same arguments;
+        # memoizing means the second call skips the encode and digest.
+        # Strings cache their own hash and compare by identity first, so a
+        # hit costs no pass over the chunk text.
+        return _hash_key(text, source_lang, target_lang, model, context_hash)
 
     def get(
         self,
@@ -98,44 +286,47 @@ class TranslationCache:
             f"  Text preview: {text[:60].replace(chr(10), ' ')}...", "DEBUG", "CACHE"
         )
 
+        with self._memory_lock:
+            remembered = self._memory.get(hash_key)
+            if remembered is not None:
+                self._memory.move_to_end(hash_key)
+        if remembered is not None:
+            debug_print(f"  [HIT] Found in memory cache", "INFO", "CACHE")
+            # Still bump last_used on disk, or entries only ever served from
+            # memory would age out in cleanup()
+            self._write_queue.put((hash_key,))
+            return dict(remembered)
+
+        with self._pending_lock:
+            pending = self._pending.get(hash_key)
+        if pending is not None:
+            debug_print(f"  [HIT] Found pending cache write", "INFO", "CACHE")
+            return {"translated_text": pending[4], "machine_translation": pending[5]}
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cur = conn.execute(
-                    """
-                    SELECT translated_text, machine_translation
-                    FROM translation_cache
-                    WHERE hash_key = ?
-                """,
-                    (hash_key,),
+            result = self.connection.execute(SELECT_SQL, (hash_key,)).fetchone()
+            if result:
+                debug_print(
+                    f"  [HIT] Found cached translation ({len(result[0])} chars)",
+                    "INFO",
+                    "CACHE",
                 )
+                debug_print(
+                    f"  [HIT] Preview: {result[0][:80].replace(chr(10), ' ')}...",
+                    "DEBUG",
+                    "CACHE",
+                )
+
+                # The last_used bump goes through the batched writer, so the
+                # lookup itself never takes the write lock
+                self._write_queue.put((hash_key,))
 
-                result = cur.fetchone()
-                if result:
-                    debug_print(
-                        f"  [HIT] Found cached translation ({len(result[0])} chars)",
-                        "INFO",
-                        "CACHE",
-                    )
-                    debug_print(
-                        f"  [HIT] Preview: {result[0][:80].replace(chr(10), ' ')}...",
-                        "DEBUG",
-                        "CACHE",
-                    )
-
-                    # Update last_used timestamp
-                    conn.execute(
-                        """
-                        UPDATE translation_cache
-                        SET last_used = CURRENT_TIMESTAMP
-                        WHERE hash_key = ?
-                    """,
-                        (hash_key,),
-                    )
-
-                    return {
-                        "translated_text": result[0],
-                        "machine_translation": result[1],
-                    }
+                cached = {
+                    "translated_text": result[0],
+                    "machine_translation": result[1],
+                }
+                self._remember(hash_key, cached)
+                return dict(cached)
 
             debug_print(f"  [MISS] No cached translation found", "INFO", "CACHE")
             return None
@@ -185,29 +376,25 @@ class TranslationCache:
             "CACHE",
         )
 
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO translation_cache
-                    (hash_key, source_lang, target_lang, original_text, translated_text,
-                     machine_translation, model, created_at, last_used)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """,
-                    (
-                        hash_key,
-                        source_lang,
-                        target_lang,
-                        text,
-                        translated_text,
-                        machine_translation,
-                        model,
-                    ),
-                )
-            debug_print(f"  [STORED] Successfully cached translation", "DEBUG", "CACHE")
-        except sqlite3.Error as e:
-            debug_print(f"  [ERROR] Cache store failed: {e}", "ERROR", "CACHE")
-            self.logger.error(f"Cache store error: {e}")
+        row = (
+            hash_key,
+            source_lang,
+            target_lang,
+            text,
+            translated_text,
+            machine_translation,
+            model,
+        )
+        with self._pending_lock:
+            self._pending[hash_key] = row
+        self._write_queue.put(row)
+        self._remember(
+            hash_key,
+            {
+                "translated_text": translated_text,
+                "machine_translation": machine_translation,
+            },
+        )
 
     def cleanup(self, days: int = None):
         """
@@ -221,33 +408,59 @@ class TranslationCache:
         if not isinstance(days, int) or days < 1:
             days = 30
 
+        self.flush()
+        self._forget_all()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Use parameterized query with julianday for safe date arithmetic
+            with self.connection as conn:
+                # Compare the bare column against a parameterized cutoff so
+                # the delete is a range scan on idx_cache_last_used
                 cursor = conn.execute(
                     """DELETE FROM translation_cache
-                       WHERE julianday('now') - julianday(last_used) > ?""",
-                    (days,),
+                       WHERE last_used < datetime('now', ?)""",
+                    (f"-{days} days",),
                 )
                 deleted = cursor.rowcount
-                if deleted > 0:
-                    self.logger.info(f"Cleaned up {deleted} old cache entries")
+            if deleted > 0:
+                # Release up to 1000 freed pages per run; the pragma only
+                # does its work as its result rows are stepped through
+                conn.execute("PRAGMA incremental_vacuum(1000)").fetchall()
+                self.logger.info(f"Cleaned up {deleted} old cache entries")
         except sqlite3.Error as e:
             self.logger.error(f"Cache cleanup error: {e}")
 
     def clear(self):
         """Clear all cached translations."""
+        self.flush()
+        self._forget_all()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection as conn:
                 conn.execute("DELETE FROM translation_cache")
-                self.logger.info("Translation cache cleared")
+            self.logger.info("Translation cache cleared")
         except sqlite3.Error as e:
             self.logger.error(f"Cache clear error: {e}")
+            return
+        self._release_free_pages(conn)
+
+    def _release_free_pages(self, conn: sqlite3.Connection) -> None:
+        """Hand the pages freed by clear() back to the filesystem."""
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+            else:
+                # A file created before incremental auto-vacuum only switches
+                # modes through a VACUUM; right after a clear there is almost
+                # nothing left for it to copy
+                conn.execute("VACUUM")
+        except sqlite3.Error as e:
+            # Another connection holding the file only delays this until the
+            # next clear; the cache itself is already empty
+            self.logger.warning(f"Cache vacuum skipped: {e}")
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
+        self.flush()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection as conn:
                 cur = conn.execute("SELECT COUNT(*) FROM translation_cache")
                 total = cur.fetchone()[0]
 
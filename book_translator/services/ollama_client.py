@@ -5,14 +5,17 @@ Client for interacting with the Ollama API.
 """
 
 import json
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 import requests
 
 from book_translator.config import config
 from book_translator.models.schemas import ModelInfo
 from book_translator.utils.logging import debug_print, get_logger
+from book_translator.utils.serialization import json_loads
 
 
 @dataclass
@@ -74,16 +77,29 @@ class OllamaClient:
         self.model = model or config.ollama.default_model
         self.logger = get_logger().app_logger
 
-        # Set up session with connection pooling
+        # Set up session with connection pooling. Keep at least one idle
+        # keep-alive connection per allowed concurrent request so parallel
+        # chunks never have to discard and reopen sockets.
         self.session = requests.Session()
         adapter = requests.adapters.HTTPAdapter(
             max_retries=config.translation.max_retries,
             pool_connections=10,
-            pool_maxsize=10,
+            pool_maxsize=max(10, config.ollama.max_concurrent_requests),
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Shared by every thread using this client, so concurrent chunks and
+        # concurrent jobs together never exceed the configured limit
+        self._request_slots = threading.BoundedSemaphore(
+            max(1, config.ollama.max_concurrent_requests)
+        )
+
+        # (monotonic time, result) of the last health probe
+        self._last_health: Tuple[float, bool] = (float("-inf"), False)
+        # (monotonic time, models) of the last successful model listing
+        self._last_models: Tuple[float, List[ModelInfo]] = (float("-inf"), [])
+
     @property
     def api_url(self) -> str:
         return f"{self.base_url}/api/generate"
@@ -94,23 +110,38 @@ class OllamaClient:
 
     def is_healthy(self) -> bool:
         """Check if Ollama is accessible."""
+        checked_at, healthy = self._last_health
+        if time.monotonic() - checked_at < config.ollama.health_cache_seconds:
+            return healthy
+
         try:
+            # Only the status matters; don't download the model list
             response = self.session.get(
-                self.models_url, timeout=config.ollama.health_check_timeout
+                self.models_url,
+                timeout=config.ollama.health_check_timeout,
+                stream=True,
             )
-            return response.status_code == 200
+            healthy = response.status_code == 200
+            response.close()
         except Exception as e:
             self.logger.warning(f"Ollama health check failed: {e}")
-            return False
+            healthy = False
+
+        self._last_health = (time.monotonic(), healthy)
+        return healthy
 
     def list_models(self) -> List[ModelInfo]:
         """List available models."""
+        fetched_at, models = self._last_models
+        if time.monotonic() - fetched_at < config.ollama.models_cache_seconds:
+            return list(models)
+
         try:
             response = self.session.get(
                 self.models_url, timeout=config.ollama.connect_timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             models = []
             for model_data in data.get("models", []):
@@ -122,7 +153,8 @@ class OllamaClient:
                         digest=model_data.get("digest"),
                     )
                 )
-            return models
+            self._last_models = (time.monotonic(), models)
+            return list(models)
         except Exception as e:
             self.logger.error(f"Failed to list models: {e}")
             return []
@@ -170,18 +202,19 @@ class OllamaClient:
             payload["think"] = think_option
 
         try:
-            response = self.session.post(
-                self.api_url,
-                json=payload,
-                timeout=(config.ollama.connect_timeout, config.ollama.read_timeout),
-            )
+            with self._request_slots:
+                response = self.session.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=(config.ollama.connect_timeout, config.ollama.read_timeout),
+                )
             response.raise_for_status()
 
             if stream:
                 # For streaming, return the response object
                 return OllamaResponse(success=True, text="", model=model)
 
-            result = response.json()
+            result = json_loads(response.content)
             text = result.get("response", "")
 
             if not text:
@@ -267,7 +300,7 @@ class OllamaClient:
             for line in response.iter_lines():
                 if line:
                     try:
-                        data = json.loads(line)
+                        data = json_loads(line)
                         if "response" in data:
                             yield data["response"]
                         if data.get("done", False):
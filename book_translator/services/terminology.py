@@ -7,6 +7,8 @@ Manages consistent terminology across translation chunks.
 import re
 from typing import Dict, List, Optional, Set
 
+from book_translator.utils.text_processing import PROPER_NOUN_RE
+
 
 class TerminologyManager:
     """Manages consistent terminology across translation chunks."""
@@ -25,10 +27,9 @@ class TerminologyManager:
         Returns:
             List of unique proper nouns
         """
-        # Match capitalized words that are not at sentence start
-        pattern = r"(?<!^)(?<![.!?]\s)\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b"
-        nouns = re.findall(pattern, text, re.MULTILINE)
-        unique_nouns = list(set(nouns))
+        # Match capitalized words that are not at sentence start; dedupe
+        # keeping first-seen order
+        unique_nouns = list(dict.fromkeys(PROPER_NOUN_RE.findall(text)))
         self.proper_nouns.update(unique_nouns)
         return unique_nouns
 
@@ -65,13 +66,25 @@ class TerminologyManager:
         Returns:
             Text with consistent terminology
         """
+        replacements: Dict[str, str] = {}
         for original, translated in chunk_terms.items():
             if original in self.terms and self.terms[original] != translated:
                 # Use consistent term from previous chunks
-                text = text.replace(translated, self.terms[original])
+                replacements[translated] = self.terms[original]
             else:
                 self.terms[original] = translated
-        return text
+
+        if not replacements:
+            return text
+
+        # Substitute every term in one scan of the text; longest terms go
+        # first so a term is preferred over any shorter term it contains
+        pattern = re.compile(
+            "|".join(
+                re.escape(term) for term in sorted(replacements, key=len, reverse=True)
+            )
+        )
+        return pattern.sub(lambda match: replacements[match.group(0)], text)
 
     def get_glossary(self) -> Dict[str, str]:
         """Get the current terminology glossary."""
@@ -6,9 +6,9 @@ Main translation service with two-stage translation approach.
 import difflib
 import hashlib
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
 from book_translator.config import config
 from book_translator.config.constants import TranslationStatus
@@ -94,7 +94,14 @@ class BookTranslator:
         genre: str = "general",
         custom_instructions: str = ""
     ) -> str:
-        """Build prompt for stage 1 (primary translation)."""
+        """
+        Build prompt for stage 1 (primary translation).
+
+        Sections are ordered from most to least stable (fixed rules, per-job
+        instructions, growing terminology, per-chunk context and text) so
+        consecutive requests share the longest possible prompt prefix, which
+        Ollama can serve from its KV cache instead of re-evaluating.
+        """
         context_section = ""
         if previous_chunk:
             context_preview = previous_chunk[-200:] if len(previous_chunk) > 200 else previous_chunk
@@ -127,7 +134,7 @@ CRITICAL RULES:
 6. Do NOT add [brackets] or markers of any kind
 7. Maintain the author's style, tone, and voice exactly
 8. Keep proper nouns and names consistent
-{terminology_section}{instructions_section}{context_section}
+{instructions_section}{terminology_section}{context_section}
 TEXT TO TRANSLATE:
 {text}
 
@@ -151,16 +158,11 @@ USER TRANSLATION INSTRUCTIONS:
 {custom_instructions}
 """
 
-        return f"""You are a professional literary editor. Review and improve this {target_lang} translation.
-
-ORIGINAL ({source_lang}):
-{original}
-
-DRAFT TRANSLATION ({target_lang}):
-{draft}
+        # Everything that is the same for every chunk of a job comes first,
+        # so Ollama can reuse the KV cache for that prefix between requests
+        return f"""You are a professional literary editor. Review and improve a {target_lang} translation of a {source_lang} text.
 
 TASK: Review for accuracy, fluency, style preservation, and consistency.
-{instructions_section}
 
 CRITICAL RULES:
 1. Output ONLY the improved translated text - nothing else
@@ -168,6 +170,12 @@ CRITICAL RULES:
 3. Do NOT add notes, explanations, or comments
 4. Do NOT include prefixes like "Improved translation:" or similar
 5. If the draft is already good, return it unchanged
+{instructions_section}
+ORIGINAL ({source_lang}):
+{original}
+
+DRAFT TRANSLATION ({target_lang}):
+{draft}
 
 OUTPUT (final translation only):"""
     
@@ -391,6 +399,73 @@ OUTPUT (final translation only):"""
             return ""
         return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()[:config.cache.context_hash_length]
     
+    def _refine_chunk(
+        self,
+        chunk_num: int,
+        total_chunks: int,
+        chunk: str,
+        draft: str,
+        draft_ok: bool,
+        context_hash: str,
+        source_lang: str,
+        target_lang: str,
+        genre: str = "general",
+        custom_instructions: str = ""
+    ) -> str:
+        """
+        Run stage 2 for one chunk, using the cache when possible.
+
+        context_hash is the context hash of the draft being refined, which is
+        all the stage 2 prompt depends on besides the chunk itself.
+        """
+
+        debug_print(f"", 'INFO', 'TRANS')
+        debug_print(f"{'='*60}", 'INFO', 'TRANS')
+        debug_print(f"[STAGE 2] Chunk {chunk_num}/{total_chunks}", 'INFO', 'TRANS')
+        debug_print(f"  Original: {len(chunk)} chars", 'DEBUG', 'TRANS')
+        debug_print(f"  Draft: {len(draft)} chars", 'DEBUG', 'TRANS')
+
+        # Check cache for stage 2
+        cached = self.cache.get(
+            chunk, source_lang, target_lang,
+            f"{self.model_name}_stage2", context_hash
+        )
+
+        if cached and not cached['translated_text'].startswith('[TRANSLATION_FAILED'):
+            final = cached['translated_text']
+            if is_likely_translated(
+                chunk, final, source_lang, target_lang,
+                config.translation.similarity_threshold
+            ):
+                debug_print(f"[CACHE HIT S2] Using cached refinement ({len(final)} chars)", 'INFO', 'CACHE')
+                debug_print(f"  Cached text: {final[:100]}...", 'DEBUG', 'CACHE')
+                return final
+
+        # Skip stage 2 if stage 1 never produced a validated translation
+        # (draft is still the model's best-effort or the original text)
+        if not draft_ok:
+            debug_print(f"[SKIP S2] Stage 1 unresolved, skipping refinement", 'WARNING', 'TRANS')
+            return draft
+
+        debug_print(f"[CACHE MISS S2] Requesting refinement", 'INFO', 'CACHE')
+
+        # Improve translation
+        final = self._translate_chunk_stage2(
+            chunk, draft, source_lang, target_lang, genre, custom_instructions
+        )
+
+        debug_print(f"[CACHE SAVE S2] Storing refinement ({len(final)} chars)", 'DEBUG', 'CACHE')
+        self.cache.set(
+            chunk, final, draft,
+            source_lang, target_lang,
+            f"{self.model_name}_stage2", context_hash
+        )
+
+        if config.translation.chunk_delay > 0:
+            time.sleep(config.translation.chunk_delay)
+
+        return final
+
     def translate_text(
         self,
         text: str,
@@ -416,6 +491,8 @@ OUTPUT (final translation only):"""
         # Normalize and split text
         text = normalize_text(text)
         chunks = split_into_chunks(text)
+        # Constant for the whole run, so build it once rather than per update
+        original_text = '\n\n'.join(chunks)
         total_chunks = len(chunks)
 
         self.logger.info(f"Starting translation: {total_chunks} chunks, {source_lang} -> {target_lang}")
@@ -434,186 +511,175 @@ OUTPUT (final translation only):"""
             preview = chunk[:80].replace('\n', ' ')
             debug_print(f"  [CHUNK {idx+1}] {len(chunk)} chars: {preview}...", 'DEBUG', 'TRANS')
         
-        # Stage 1: Primary translations
+        # Stage 2 of a chunk only depends on that chunk's draft, so with
+        # parallel processing enabled each refinement starts as soon as its
+        # draft lands, overlapping with stage 1 of the following chunks.
+        # Stage 1 keeps one request slot for itself and the remaining slots
+        # go to refinement workers. Results are reported in chunk order.
+        pipelined = config.translation.enable_parallel and config.ollama.max_concurrent_requests > 1
+        workers = config.ollama.max_concurrent_requests - 1 if pipelined else 1
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='refine')
+        refinements = []
         draft_translations: List[str] = []
         stage1_success: List[bool] = []
-
-        for i, chunk in enumerate(chunks):
-            chunk_num = i + 1
-            previous_chunk = draft_translations[-1] if draft_translations else ""
-            context_hash = self._get_context_hash(previous_chunk, custom_instructions)
-
-            debug_print(f"", 'INFO', 'TRANS')
-            debug_print(f"{'='*60}", 'INFO', 'TRANS')
-            debug_print(f"[STAGE 1] Chunk {chunk_num}/{total_chunks}", 'INFO', 'TRANS')
-            debug_print(f"  Chunk size: {len(chunk)} chars", 'DEBUG', 'TRANS')
-            debug_print(f"  Context hash: {context_hash[:16] if context_hash else 'none'}...", 'DEBUG', 'TRANS')
-
-            # Check cache
-            cached = self.cache.get(
-                chunk, source_lang, target_lang,
-                f"{self.model_name}_stage1", context_hash
-            )
-
-            if cached and not cached['translated_text'].startswith('[TRANSLATION_FAILED'):
-                draft = cached['machine_translation'] or cached['translated_text']
-                if is_likely_translated(
-                    chunk, draft, source_lang, target_lang,
-                    config.translation.similarity_threshold
-                ):
-                    debug_print(f"[CACHE HIT] Using cached translation ({len(draft)} chars)", 'INFO', 'CACHE')
-                    debug_print(f"  Cached text: {draft[:100]}...", 'DEBUG', 'CACHE')
-                    draft_translations.append(draft)
-                    stage1_success.append(True)
-
-                    yield TranslationProgress(
-                        progress=(chunk_num / (total_chunks * 2)) * 100,
-                        stage='primary_translation',
-                        original_text='\n\n'.join(chunks),
-                        machine_translation='\n\n'.join(draft_translations),
-                        current_chunk=chunk_num,
-                        total_chunks=total_chunks * 2
-                    )
-                    continue
-
-            debug_print(f"[CACHE MISS] Requesting new translation", 'INFO', 'CACHE')
-
-            # Translate
-            draft, stage1_ok = self._translate_chunk_stage1(
-                chunk, source_lang, target_lang, previous_chunk, genre, custom_instructions
-            )
-
-            if stage1_ok:
-                debug_print(f"[CACHE SAVE] Storing translation ({len(draft)} chars)", 'DEBUG', 'CACHE')
-                # Cache successful translation
-                self.cache.set(
-                    chunk, draft, draft,
-                    source_lang, target_lang,
+        # Context hash of each draft, computed once when the draft lands: it
+        # keys both the next chunk's stage 1 and this chunk's stage 2 entry
+        draft_hashes: List[str] = []
+
+        # Repeated chunks (headings, separators, boilerplate) usually get the
+        # same draft too; they share one refinement instead of each sending
+        # a request before the first one has reached the cache
+        refinements_by_input: Dict[Tuple[str, str, bool], Future] = {}
+
+        def submit_refinement(i: int) -> None:
+            key = (chunks[i], draft_translations[i], stage1_success[i])
+            future = refinements_by_input.get(key)
+            if future is None:
+                future = pool.submit(
+                    self._refine_chunk, i + 1, total_chunks, chunks[i],
+                    draft_translations[i], stage1_success[i], draft_hashes[i],
+                    source_lang, target_lang, genre, custom_instructions
+                )
+                refinements_by_input[key] = future
+            refinements.append(future)
+
+        try:
+            # Stage 1: Primary translations
+            for i, chunk in enumerate(chunks):
+                chunk_num = i + 1
+                if draft_translations:
+                    previous_chunk = draft_translations[-1]
+                    context_hash = draft_hashes[-1]
+                else:
+                    previous_chunk = ""
+                    context_hash = self._get_context_hash("", custom_instructions)
+
+                debug_print(f"", 'INFO', 'TRANS')
+                debug_print(f"{'='*60}", 'INFO', 'TRANS')
+                debug_print(f"[STAGE 1] Chunk {chunk_num}/{total_chunks}", 'INFO', 'TRANS')
+                debug_print(f"  Chunk size: {len(chunk)} chars", 'DEBUG', 'TRANS')
+                debug_print(f"  Context hash: {context_hash[:16] if context_hash else 'none'}...", 'DEBUG', 'TRANS')
+
+                # Check cache
+                cached = self.cache.get(
+                    chunk, source_lang, target_lang,
                     f"{self.model_name}_stage1", context_hash
                 )
-            else:
-                debug_print(f"[NO CACHE] Skipping cache store for unresolved chunk", 'WARNING', 'CACHE')
-
-            draft_translations.append(draft)
-            stage1_success.append(stage1_ok)
-            progress_pct = (chunk_num / (total_chunks * 2)) * 100
-            debug_print(f"[PROGRESS] {progress_pct:.1f}% complete", 'INFO', 'TRANS')
-
-            yield TranslationProgress(
-                progress=progress_pct,
-                stage='primary_translation',
-                original_text='\n\n'.join(chunks),
-                machine_translation='\n\n'.join(draft_translations),
-                current_chunk=chunk_num,
-                total_chunks=total_chunks * 2
-            )
 
-            # Delay between chunks
-            if config.translation.chunk_delay > 0:
-                time.sleep(config.translation.chunk_delay)
-        
-        # Stage 2: Reflection and improvement
-        debug_print(f"", 'INFO', 'TRANS')
-        debug_print(f"{'='*60}", 'INFO', 'TRANS')
-        debug_print(f"[STAGE 2 START] Beginning refinement phase", 'INFO', 'TRANS')
-        debug_print(f"{'='*60}", 'INFO', 'TRANS')
-
-        final_translations: List[str] = []
+                if cached and not cached['translated_text'].startswith('[TRANSLATION_FAILED'):
+                    draft = cached['machine_translation'] or cached['translated_text']
+                    if is_likely_translated(
+                        chunk, draft, source_lang, target_lang,
+                        config.translation.similarity_threshold
+                    ):
+                        debug_print(f"[CACHE HIT] Using cached translation ({len(draft)} chars)", 'INFO', 'CACHE')
+                        debug_print(f"  Cached text: {draft[:100]}...", 'DEBUG', 'CACHE')
+                        draft_translations.append(draft)
+                        stage1_success.append(True)
+                        draft_hashes.append(self._get_context_hash(draft, custom_instructions))
+                        if pipelined:
+                            submit_refinement(i)
+
+                        yield TranslationProgress(
+                            progress=(chunk_num / (total_chunks * 2)) * 100,
+                            stage='primary_translation',
+                            original_text=original_text,
+                            machine_chunks=tuple(draft_translations),
+                            current_chunk=chunk_num,
+                            total_chunks=total_chunks * 2
+                        )
+                        continue
 
-        for i, (chunk, draft, draft_ok) in enumerate(zip(chunks, draft_translations, stage1_success)):
-            chunk_num = i + 1
-            previous_final = final_translations[-1] if final_translations else ""
-            context_hash = self._get_context_hash(previous_final, custom_instructions)
+                debug_print(f"[CACHE MISS] Requesting new translation", 'INFO', 'CACHE')
 
-            debug_print(f"", 'INFO', 'TRANS')
-            debug_print(f"{'='*60}", 'INFO', 'TRANS')
-            debug_print(f"[STAGE 2] Chunk {chunk_num}/{total_chunks}", 'INFO', 'TRANS')
-            debug_print(f"  Original: {len(chunk)} chars", 'DEBUG', 'TRANS')
-            debug_print(f"  Draft: {len(draft)} chars", 'DEBUG', 'TRANS')
-
-            # Check cache for stage 2
-            cached = self.cache.get(
-                chunk, source_lang, target_lang,
-                f"{self.model_name}_stage2", context_hash
-            )
+                # Translate
+                draft, stage1_ok = self._translate_chunk_stage1(
+                    chunk, source_lang, target_lang, previous_chunk, genre, custom_instructions
+                )
 
-            if cached and not cached['translated_text'].startswith('[TRANSLATION_FAILED'):
-                final = cached['translated_text']
-                if is_likely_translated(
-                    chunk, final, source_lang, target_lang,
-                    config.translation.similarity_threshold
-                ):
-                    debug_print(f"[CACHE HIT S2] Using cached refinement ({len(final)} chars)", 'INFO', 'CACHE')
-                    debug_print(f"  Cached text: {final[:100]}...", 'DEBUG', 'CACHE')
-                    final_translations.append(final)
-
-                    yield TranslationProgress(
-                        progress=((chunk_num + total_chunks) / (total_chunks * 2)) * 100,
-                        stage='reflection_improvement',
-                        original_text='\n\n'.join(chunks),
-                        machine_translation='\n\n'.join(draft_translations),
-                        translated_text='\n\n'.join(final_translations),
-                        current_chunk=chunk_num + total_chunks,
-                        total_chunks=total_chunks * 2
+                if stage1_ok:
+                    debug_print(f"[CACHE SAVE] Storing translation ({len(draft)} chars)", 'DEBUG', 'CACHE')
+                    # Cache successful translation
+                    self.cache.set(
+                        chunk, draft, draft,
+                        source_lang, target_lang,
+                        f"{self.model_name}_stage1", context_hash
                     )
-                    continue
+                else:
+                    debug_print(f"[NO CACHE] Skipping cache store for unresolved chunk", 'WARNING', 'CACHE')
+
+                draft_translations.append(draft)
+                stage1_success.append(stage1_ok)
+                draft_hashes.append(self._get_context_hash(draft, custom_instructions))
+                if pipelined:
+                    submit_refinement(i)
+                progress_pct = (chunk_num / (total_chunks * 2)) * 100
+                debug_print(f"[PROGRESS] {progress_pct:.1f}% complete", 'INFO', 'TRANS')
+
+                yield TranslationProgress(
+                    progress=progress_pct,
+                    stage='primary_translation',
+                    original_text=original_text,
+                    machine_chunks=tuple(draft_translations),
+                    current_chunk=chunk_num,
+                    total_chunks=total_chunks * 2
+                )
 
-            # Skip stage 2 if stage 1 never produced a validated translation
-            # (draft is still the model's best-effort or the original text)
-            if not draft_ok:
-                debug_print(f"[SKIP S2] Stage 1 unresolved, skipping refinement", 'WARNING', 'TRANS')
-                final_translations.append(draft)
-            else:
-                debug_print(f"[CACHE MISS S2] Requesting refinement", 'INFO', 'CACHE')
+                # Delay between chunks
+                if config.translation.chunk_delay > 0:
+                    time.sleep(config.translation.chunk_delay)
 
-                # Improve translation
-                final = self._translate_chunk_stage2(
-                    chunk, draft, source_lang, target_lang, genre, custom_instructions
-                )
+            # Stage 2: Reflection and improvement
+            debug_print(f"", 'INFO', 'TRANS')
+            debug_print(f"{'='*60}", 'INFO', 'TRANS')
+            debug_print(f"[STAGE 2 START] Beginning refinement phase", 'INFO', 'TRANS')
+            debug_print(f"{'='*60}", 'INFO', 'TRANS')
 
-                debug_print(f"[CACHE SAVE S2] Storing refinement ({len(final)} chars)", 'DEBUG', 'CACHE')
-                self.cache.set(
-                    chunk, final, draft,
-                    source_lang, target_lang,
-                    f"{self.model_name}_stage2", context_hash
-                )
+            if not pipelined:
+                for i in range(total_chunks):
+                    submit_refinement(i)
 
-                final_translations.append(final)
+            final_translations: List[str] = []
 
-            progress_pct = ((chunk_num + total_chunks) / (total_chunks * 2)) * 100
-            debug_print(f"[PROGRESS] {progress_pct:.1f}% complete", 'INFO', 'TRANS')
+            for i, future in enumerate(refinements):
+                chunk_num = i + 1
+                final_translations.append(future.result())
 
-            yield TranslationProgress(
-                progress=progress_pct,
-                stage='reflection_improvement',
-                original_text='\n\n'.join(chunks),
-                machine_translation='\n\n'.join(draft_translations),
-                translated_text='\n\n'.join(final_translations),
-                current_chunk=chunk_num + total_chunks,
-                total_chunks=total_chunks * 2
-            )
+                progress_pct = ((chunk_num + total_chunks) / (total_chunks * 2)) * 100
+                debug_print(f"[PROGRESS] {progress_pct:.1f}% complete", 'INFO', 'TRANS')
 
-            if config.translation.chunk_delay > 0:
-                time.sleep(config.translation.chunk_delay)
+                yield TranslationProgress(
+                    progress=progress_pct,
+                    stage='reflection_improvement',
+                    original_text=original_text,
+                    machine_chunks=tuple(draft_translations),
+                    translated_chunks=tuple(final_translations),
+                    current_chunk=chunk_num + total_chunks,
+                    total_chunks=total_chunks * 2
+                )
+        finally:
+            # Don't start queued refinements if the caller stops consuming
+            pool.shutdown(wait=False, cancel_futures=True)
         
         # Final result
         self.logger.info(f"Translation complete: {total_chunks} chunks processed")
 
-        final_text = '\n\n'.join(final_translations)
+        result = TranslationProgress(
+            progress=100,
+            stage='completed',
+            original_text=original_text,
+            machine_chunks=tuple(draft_translations),
+            translated_chunks=tuple(final_translations),
+            current_chunk=total_chunks * 2,
+            total_chunks=total_chunks * 2
+        )
+
         debug_print(f"", 'INFO', 'TRANS')
         debug_print(f"{'='*60}", 'INFO', 'TRANS')
         debug_print(f"[TRANSLATION COMPLETE]", 'INFO', 'TRANS')
         debug_print(f"  Chunks processed: {total_chunks}", 'INFO', 'TRANS')
         debug_print(f"  Original length: {len(text)} chars", 'INFO', 'TRANS')
-        debug_print(f"  Final length: {len(final_text)} chars", 'INFO', 'TRANS')
+        debug_print(f"  Final length: {len(result.translated_text)} chars", 'INFO', 'TRANS')
         debug_print(f"{'='*60}", 'INFO', 'TRANS')
 
-        yield TranslationProgress(
-            progress=100,
-            stage='completed',
-            original_text='\n\n'.join(chunks),
-            machine_translation='\n\n'.join(draft_translations),
-            translated_text=final_text,
-            current_chunk=total_chunks * 2,
-            total_chunks=total_chunks * 2
-        )
+        yield result
@@ -8,8 +8,10 @@ from book_translator.utils.language_detection import (
     is_likely_translated,
 )
 from book_translator.utils.logging import AppLogger, LogBuffer, debug_print, get_logger
+from book_translator.utils.serialization import json_dumps, json_loads
 from book_translator.utils.text_processing import (
     clean_translation_response,
+    iter_chunks,
     normalize_text,
     split_into_chunks,
 )
@@ -24,6 +26,7 @@ __all__ = [
     "detect_language",
     "is_likely_translated",
     "split_into_chunks",
+    "iter_chunks",
     "clean_translation_response",
     "normalize_text",
     "validate_file",
@@ -33,4 +36,6 @@ __all__ = [
     "AppLogger",
     "get_logger",
     "debug_print",
+    "json_dumps",
+    "json_loads",
 ]
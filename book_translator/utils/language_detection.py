@@ -4,47 +4,154 @@ Language Detection Utilities
 Functions for detecting language and validating translations.
 """
 
-from typing import List, Set, Tuple
+from collections import Counter
+from functools import cached_property, lru_cache
+from itertools import compress, islice
+from operator import eq
+from typing import Dict, FrozenSet, List, Set, Tuple
 
 from book_translator.config.constants import LANGUAGE_MARKERS
 
 
-def detect_language_markers(text: str, language: str) -> Tuple[int, List[str], float]:
+def _word_scan_table(
+    markers: List[str],
+) -> Tuple[Dict[str, Tuple[int, str]], Tuple[Tuple[int, str], ...]]:
     """
-    Detect language markers in text.
+    Precompute how each marker of a word language is counted.
+
+    Single-word markers such as " the " are matched against the text's
+    space-separated tokens, so one split serves all of them and only the
+    words actually present are visited. Multi-word and elided markers
+    (" of the ", " l'") keep using substring counts.
 
     Args:
-        text: The text to analyze
-        language: The language code to check for (e.g., 'en', 'es')
+        markers: The language's markers
 
     Returns:
-        Tuple of (marker_count, found_markers, ratio)
+        Tuple of (word -> (position, marker), ((position, marker), ...)) for
+        single-word and substring markers; positions keep the markers'
+        definition order
     """
-    if language not in LANGUAGE_MARKERS:
-        return 0, [], 0.0
+    words = {}
+    substrings = []
+    for position, marker in enumerate(markers):
+        marker = marker.lower()
+        word = marker[1:-1]
+        if marker[:1] == marker[-1:] == " " and word and " " not in word:
+            words[word] = (position, marker)
+        else:
+            substrings.append((position, marker))
+    return words, tuple(substrings)
+
+
+_WORD_SCAN_TABLES = {
+    language: _word_scan_table(lang_info["markers"])
+    for language, lang_info in LANGUAGE_MARKERS.items()
+    if lang_info["type"] == "word"
+}
 
-    lang_info = LANGUAGE_MARKERS[language]
-    markers = lang_info["markers"]
-    marker_type = lang_info["type"]
 
-    text_lower = text.lower()
-    if marker_type == "word":
-        text_lower = " " + text_lower + " "
+class _MarkerText:
+    """
+    A text prepared for marker counting.
+
+    The lowercased, padded copy and its tokens are built on first use and
+    shared by every language probed against the same text. Character
+    languages match the raw text: their markers have no case.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def padded(self) -> str:
+        return " " + self.text.lower() + " "
+
+    @cached_property
+    def words(self) -> Tuple[Counter, Set[str]]:
+        """Token counts of the padded text, and the tokens repeated in a row."""
+        words = self.padded.split(" ")
+        # str.count skips a repeat that shares its leading space with the
+        # previous match ("the the"), so repeated words defer to it
+        repeated = set(compress(words, map(eq, words, islice(words, 1, None))))
+        return Counter(words), repeated
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.text.split())
+
+
+def _count_word_markers(
+    marker_text: _MarkerText, language: str
+) -> Tuple[int, List[str], float]:
+    """Count a word language's markers; the ratio is per word."""
+    text_lower = marker_text.padded
+    tokens, repeated = marker_text.words
+    words, substrings = _WORD_SCAN_TABLES[language]
+
+    hits = []
+    for word in tokens.keys() & words.keys():
+        position, marker = words[word]
+        if word in repeated:
+            hits.append((position, marker, text_lower.count(marker)))
+        else:
+            hits.append((position, marker, tokens[word]))
+    for position, marker in substrings:
+        occurrences = text_lower.count(marker)
+        if occurrences > 0:
+            hits.append((position, marker, occurrences))
+    hits.sort()
+
+    count = sum(occurrences for _, _, occurrences in hits)
+    found = [marker.strip() for _, marker, _ in hits]
+
+    return count, found, count / max(marker_text.word_count, 1)
+
+
+def _count_character_markers(
+    marker_text: _MarkerText, language: str
+) -> Tuple[int, List[str], float]:
+    """Count a character language's markers; the ratio is per character."""
+    text = marker_text.text
 
     found = []
     count = 0
-
-    for marker in markers:
-        occurrences = text_lower.count(marker.lower())
+    for marker in LANGUAGE_MARKERS[language]["markers"]:
+        occurrences = text.count(marker)
         if occurrences > 0:
             count += occurrences
             found.append(marker.strip())
 
-    # Calculate ratio based on text length
-    text_length = len(text.split()) if marker_type == "word" else len(text)
-    ratio = count / max(text_length, 1)
+    return count, found, count / max(len(text), 1)
 
-    return count, found, ratio
+
+_MARKER_COUNTERS = {
+    "word": _count_word_markers,
+    "character": _count_character_markers,
+}
+
+
+def _count_markers(
+    marker_text: _MarkerText, language: str
+) -> Tuple[int, List[str], float]:
+    """Count one language's markers in a prepared text."""
+    if language not in LANGUAGE_MARKERS:
+        return 0, [], 0.0
+    return _MARKER_COUNTERS[LANGUAGE_MARKERS[language]["type"]](marker_text, language)
+
+
+def detect_language_markers(text: str, language: str) -> Tuple[int, List[str], float]:
+    """
+    Detect language markers in text.
+
+    Args:
+        text: The text to analyze
+        language: The language code to check for (e.g., 'en', 'es')
+
+    Returns:
+        Tuple of (marker_count, found_markers, ratio)
+    """
+    return _count_markers(_MarkerText(text), language)
 
 
 def detect_language(text: str, candidates: List[str] = None) -> Tuple[str, float]:
@@ -64,8 +171,9 @@ def detect_language(text: str, candidates: List[str] = None) -> Tuple[str, float
     best_lang = "unknown"
     best_score = 0.0
 
+    marker_text = _MarkerText(text)
     for lang in candidates:
-        count, _, ratio = detect_language_markers(text, lang)
+        count, _, ratio = _count_markers(marker_text, lang)
         min_markers = LANGUAGE_MARKERS.get(lang, {}).get("min_markers", 3)
 
         # Score based on both count and ratio
@@ -81,6 +189,13 @@ def detect_language(text: str, candidates: List[str] = None) -> Tuple[str, float
     return best_lang, confidence
 
 
+@lru_cache(maxsize=64)
+def _source_profile(original: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Lowercased tokens and distinct words of a source chunk."""
+    tokens = tuple(original.lower().split())
+    return tokens, frozenset(tokens)
+
+
 def is_likely_translated(
     original: str,
     translated: str,
@@ -112,36 +227,37 @@ def is_likely_translated(
     if len(translated) < 50:
         return True
 
-    # Normalize texts for comparison (for Latin-alphabet languages)
-    orig_normalized = " ".join(original.lower().split())
-    trans_normalized = " ".join(translated.lower().split())
+    # Tokenize once; comparing token lists is equivalent to comparing the
+    # whitespace-collapsed texts without building and re-splitting them.
+    # The same source chunk is checked against its cached draft, the fresh
+    # draft and the refinement, so its side of the comparison is memoized.
+    orig_tokens, orig_words = _source_profile(original)
+    trans_tokens = translated.lower().split()
 
     # If they're identical, translation definitely failed
-    if orig_normalized == trans_normalized:
+    if orig_tokens == tuple(trans_tokens):
         return False
 
     # For Latin-alphabet languages: Calculate word similarity
     if source_lang not in ["zh", "ja", "ko"]:
-        orig_words = set(orig_normalized.split())
-        trans_words = set(trans_normalized.split())
-
         if len(orig_words) > 0:
-            common_words = orig_words.intersection(trans_words)
-            similarity = len(common_words) / len(orig_words)
+            common_count = len(orig_words.intersection(trans_tokens))
+            similarity = common_count / len(orig_words)
 
             # Reject if similarity is very high
             if similarity > similarity_threshold:
                 return False
 
     # Check source language markers in translation
+    marker_text = _MarkerText(translated)
     if source_lang in LANGUAGE_MARKERS:
-        source_count, _, source_ratio = detect_language_markers(translated, source_lang)
+        source_count, _, source_ratio = _count_markers(marker_text, source_lang)
         lang_info = LANGUAGE_MARKERS[source_lang]
         min_markers = lang_info["min_markers"]
 
         # Calculate threshold based on text length
         word_count = (
-            len(translated.split()) if lang_info["type"] == "word" else len(translated)
+            len(trans_tokens) if lang_info["type"] == "word" else len(translated)
         )
 
         if lang_info["type"] == "word":
@@ -152,12 +268,13 @@ def is_likely_translated(
         if source_count > threshold:
             return False
 
-    # Verify target language markers are present
-    if target_lang in LANGUAGE_MARKERS:
-        target_count, _, _ = detect_language_markers(translated, target_lang)
+    # Verify target language markers are present; short texts are exempt, so
+    # don't scan them at all
+    if target_lang in LANGUAGE_MARKERS and len(translated) > 100:
+        target_count, _, _ = _count_markers(marker_text, target_lang)
         target_min = LANGUAGE_MARKERS[target_lang]["min_markers"]
 
-        if target_count < target_min and len(translated) > 100:
+        if target_count < target_min:
             return False
 
     return True
@@ -4,13 +4,16 @@ Logging Utilities
 Centralized logging configuration and utilities.
 """
 
+import atexit
 import logging
 import os
+import queue
 import re
 import threading
 from collections import deque
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, List, Optional
 
 from book_translator.config import config
@@ -30,7 +33,8 @@ class LogBuffer:
             self.last_id += 1
             entry = {
                 "id": self.last_id,
-                "timestamp": datetime.now().strftime("%H:%M:%S.%f")[:-3],
+                # HH:MM:SS.mmm; isoformat is about twice as fast as strftime
+                "timestamp": datetime.now().isoformat(timespec="milliseconds")[11:],
                 "level": level,
                 "source": source,
                 "message": message,
@@ -46,7 +50,14 @@ class LogBuffer:
     def get_since(self, since_id: int) -> List[Dict]:
         """Get log entries since a specific ID."""
         with self.lock:
-            return [e for e in self.buffer if e["id"] > since_id]
+            # IDs are consecutive, so the newer entries are the last
+            # `last_id - since_id` ones; walk only those from the right
+            newer = min(self.last_id - since_id, len(self.buffer))
+            if newer <= 0:
+                return []
+            entries = list(islice(reversed(self.buffer), newer))
+        entries.reverse()
+        return entries
 
     def clear(self):
         """Clear the buffer."""
@@ -69,6 +80,31 @@ class ANSIStripFormatter(logging.Formatter):
         return self.ANSI_PATTERN.sub("", message)
 
 
+# Records from every application logger go through one queue, and a single
+# background listener formats and writes them, so calling threads only
+# enqueue and never wait on file I/O (rollover included).
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Stop the shared log listener, draining whatever is still queued."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+def _start_log_listener(handlers: List[logging.Handler]) -> None:
+    """Start the shared log listener, or restart it with extra handlers."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        handlers = list(_log_listener.handlers) + handlers
+    else:
+        atexit.register(_stop_log_listener)
+    _log_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
+
 class AppLogger:
     """Application logger with multiple handlers."""
 
@@ -76,16 +112,35 @@ class AppLogger:
         self.log_dir = log_dir or config.paths.log_folder
         os.makedirs(self.log_dir, exist_ok=True)
 
-        # Create loggers
-        self.app_logger = self._setup_logger("book_translator.app", "app.log")
+        # Create loggers, collecting the handlers of any newly set up ones
+        handlers: List[logging.Handler] = []
+        self.app_logger = self._setup_logger("book_translator.app", "app.log", handlers)
         self.translation_logger = self._setup_logger(
-            "book_translator.translation", "translations.log"
+            "book_translator.translation", "translations.log", handlers
+        )
+        self.api_logger = self._setup_logger("book_translator.api", "api.log", handlers)
+        self.db_logger = self._setup_logger(
+            "book_translator.database", "database.log", handlers
         )
-        self.api_logger = self._setup_logger("book_translator.api", "api.log")
-        self.db_logger = self._setup_logger("book_translator.database", "database.log")
 
-    def _setup_logger(self, name: str, filename: str) -> logging.Logger:
-        """Set up a logger with file and console handlers."""
+        if handlers:
+            # Console handler, shared by every logger
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(
+                logging.DEBUG if config.logging.verbose_debug else logging.INFO
+            )
+            console_handler.setFormatter(
+                logging.Formatter(
+                    "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
+                )
+            )
+            handlers.append(console_handler)
+            _start_log_listener(handlers)
+
+    def _setup_logger(
+        self, name: str, filename: str, handlers: List[logging.Handler]
+    ) -> logging.Logger:
+        """Set up a logger that enqueues to the shared listener."""
         logger = logging.getLogger(name)
         logger.setLevel(logging.DEBUG if config.logging.verbose_debug else logging.INFO)
 
@@ -93,7 +148,8 @@ class AppLogger:
         if logger.handlers:
             return logger
 
-        # File handler with ANSI stripping
+        # File handler with ANSI stripping; the listener sees every logger's
+        # records, so the filter keeps only this logger's in its file
         file_path = os.path.join(self.log_dir, filename)
         file_handler = RotatingFileHandler(
             file_path,
@@ -104,19 +160,10 @@ class AppLogger:
         file_handler.setFormatter(
             ANSIStripFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
-        logger.addHandler(file_handler)
+        file_handler.addFilter(logging.Filter(name))
+        handlers.append(file_handler)
 
-        # Console handler (with colors)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(
-            logging.DEBUG if config.logging.verbose_debug else logging.INFO
-        )
-        console_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
-            )
-        )
-        logger.addHandler(console_handler)
+        logger.addHandler(QueueHandler(_log_queue))
 
         return logger
 
@@ -142,8 +189,11 @@ def debug_print(message: str, level: str = "INFO", source: str = "DEBUG"):
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         source: Source identifier
     """
-    # Strip ANSI codes for the buffer
-    clean_message = re.sub(r"\033\[[0-9;]*m", "", message)
+    # Strip ANSI codes for the buffer; most messages have none, and the
+    # substring check is far cheaper than running the regex
+    clean_message = message
+    if "\033" in message:
+        clean_message = ANSIStripFormatter.ANSI_PATTERN.sub("", message)
     log_buffer.add(level, source, clean_message)
 
     # Print to console with colors if verbose
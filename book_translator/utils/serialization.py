@@ -0,0 +1,52 @@
+"""
+Serialization Utilities
+=======================
+JSON parsing and encoding backed by orjson when it is installed.
+"""
+
+import json
+from typing import Any, Union
+
+# orjson is optional: it parses straight from bytes and is several times
+# faster than the stdlib on the multi-KB responses Ollama returns. Its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same
+# exception either way.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or raw UTF-8 bytes
+
+    Returns:
+        The parsed Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    Non-ASCII characters are written as-is rather than \\u-escaped, matching
+    orjson's output when falling back to the stdlib.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        The encoded document as bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -5,11 +5,116 @@ Functions for processing and manipulating text.
 """
 
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from book_translator.config import config
 from book_translator.utils.logging import debug_print
 
+# Patterns used on every chunk are compiled once at import time rather than
+# going through re's pattern cache on each call.
+# The leading lookahead rejects most positions on one character test before
+# the lookbehinds run.
+PROPER_NOUN_RE = re.compile(
+    r"(?=[A-Z])(?<!^)(?<![.!?]\s)\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", re.MULTILINE
+)
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_THINK_FLAGS = re.DOTALL | re.IGNORECASE
+_THINK_BLOCK_PATTERNS = [
+    # Closed thinking/reasoning blocks (common in reasoning models like DeepSeek)
+    re.compile(r"<think>.*?</think>", _THINK_FLAGS),
+    re.compile(r"<thinking>.*?</thinking>", _THINK_FLAGS),
+    re.compile(r"<reasoning>.*?</reasoning>", _THINK_FLAGS),
+    re.compile(r"<reflection>.*?</reflection>", _THINK_FLAGS),
+    # Unclosed thinking tags (if model was cut off)
+    re.compile(r"<think>.*$", _THINK_FLAGS),
+    re.compile(r"<thinking>.*$", _THINK_FLAGS),
+]
+
+# These are patterns where the model echoes parts of the prompt
+_UNWANTED_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    for pattern in [
+        # English instruction echoes
+        r"IMPORTANT:\s*Return ONLY the translation[^\n]*\n*",
+        r"IMPORTANT:\s*Devolver SOLO la traducción[^\n]*\n*",
+        r"IMPORTANTE:\s*Devolver SOLO la traducción[^\n]*\n*",
+        r"IMPORTANTE:\s*Devuelve SOLO la traducción[^\n]*\n*",
+        r"IMPORTANTE:\s*Return ONLY[^\n]*\n*",
+        r"Return ONLY the translation[^\n]*\n*",
+        r"Devolver SOLO la traducción[^\n]*\n*",
+        r"No repita contenido previo[^\n]*\n*",
+        r"Do not repeat previous content[^\n]*\n*",
+        # Section headers from prompts
+        r"TEXT TO TRANSLATE:.*?\n+",
+        r"TEXTO A TRADUCIR:.*?\n+",
+        r"ORIGINAL TEXT:.*?\n+",
+        r"TEXTO ORIGINAL:.*?\n+",
+        r"CONTEXT \(previous translation[^\)]*\):.*?\n+",
+        r"CONTEXTO \(traducción anterior[^\)]*\):.*?\n+",
+        # Requirements section echoes
+        r"REQUIREMENTS:.*?(?=\n[A-Z]|\n\n|\Z)",
+        r"REQUISITOS:.*?(?=\n[A-Z]|\n\n|\Z)",
+        r"GENRE:.*?\n+",
+        r"GÉNERO:.*?\n+",
+        # Common LLM prefixes
+        r"^\s*Here is the translation:?\s*\n*",
+        r"^\s*Here\'s the translation:?\s*\n*",
+        r"^\s*Aquí está la traducción:?\s*\n*",
+        r"^\s*La traducción es:?\s*\n*",
+        r"^\s*Translation:?\s*\n*",
+        r"^\s*Traducción:?\s*\n*",
+        r"^\s*Translated text:?\s*\n*",
+        r"^\s*Texto traducido:?\s*\n*",
+        r"^\s*\*\*Translation:?\*\*\s*\n*",
+        r"^\s*\*\*Traducción:?\*\*\s*\n*",
+        # Markdown artifacts
+        r"^\s*---+\s*\n*",
+        r"^\s*\*\*\*+\s*\n*",
+        r"^\s*```[a-z]*\s*\n*",
+        r"\s*```\s*$",
+        # Notes/explanations wrapped in brackets (bounded, safe anywhere)
+        r"\n+\[Note:.*?\]",
+        r"\n+\[Nota:.*?\]",
+    ]
+]
+
+_TRAILING_NOTE_RE = re.compile(
+    r"^\*{0,2}(?:Note|Nota)\s*:\s*.+$", re.IGNORECASE | re.DOTALL
+)
+
+# Sometimes the model includes the "previous translation for continuity" context
+_CONTEXT_MARKER_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in [
+        r"^.*?(?:for continuity|para continuidad):?\s*\n+",
+        r"^.*?(?:previous translation|traducción anterior):?\s*\n+",
+        r"INICIOS?\s*\n+",  # Sometimes models output this marker
+        r"BEGINNINGS?\s*\n+",
+    ]
+]
+
+_EPUB_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+_EPUB_THINK_PATTERNS = [
+    re.compile(r"<think>.*?</think>", _THINK_FLAGS),
+    re.compile(r"<thinking>.*?</thinking>", _THINK_FLAGS),
+    re.compile(r"<think>.*$", _THINK_FLAGS),
+]
+_EPUB_INSTRUCTION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in [
+        r"IMPORTANT:.*?(?:\n|$)",
+        r"IMPORTANTE:.*?(?:\n|$)",
+        r"REQUIREMENTS:.*?(?:\n\n|\Z)",
+        r"REQUISITOS:.*?(?:\n\n|\Z)",
+        r"\[⚠️[^\]]*\]",
+        r"Note:.*?(?:\n|$)",
+        r"Nota:.*?(?:\n|$)",
+    ]
+]
+_UNESCAPED_AMPERSAND_RE = re.compile(r"&(?!(amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)")
+
 
 def normalize_text(text: str) -> str:
     """
@@ -25,32 +130,30 @@ def normalize_text(text: str) -> str:
     # Normalize line endings
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     # Remove excessive blank lines (keep max 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXCESS_BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
-def split_into_chunks(text: str, max_length: int = None) -> List[str]:
+def iter_chunks(text: str, max_length: int = None) -> Iterator[str]:
     """
-    Split text into smaller chunks for translation.
-    Ensures clean boundaries at paragraph level when possible.
-    Preserves original formatting (paragraphs, dialogue, etc.)
+    Lazily split text into chunks for translation.
+    Yields each chunk as soon as it is complete, so callers that stream
+    chunks onward never hold the whole chunk list.
 
     Args:
         text: Text to split
         max_length: Maximum chunk length (uses config if not specified)
 
-    Returns:
-        List of text chunks
+    Yields:
+        Text chunks, in order
     """
     if max_length is None:
         max_length = config.translation.max_prompt_length
 
-    paragraphs = text.split("\n\n")
-    chunks = []
     current_chunk = []
     current_length = 0
 
-    for paragraph in paragraphs:
+    for paragraph in text.split("\n\n"):
         paragraph = paragraph.strip()
         if not paragraph:
             continue
@@ -60,30 +163,29 @@ def split_into_chunks(text: str, max_length: int = None) -> List[str]:
         # If single paragraph is too long, split by sentences
         if para_length > max_length:
             if current_chunk:
-                chunks.append("\n\n".join(current_chunk))
+                yield "\n\n".join(current_chunk)
                 current_chunk = []
                 current_length = 0
 
             # Split long paragraph by sentences
-            sentences = re.split(r"(?<=[.!?])\s+", paragraph)
             sentence_chunk = []
             sentence_length = 0
 
-            for sentence in sentences:
+            for sentence in SENTENCE_RE.split(paragraph):
                 if sentence_length + len(sentence) > max_length and sentence_chunk:
-                    chunks.append(" ".join(sentence_chunk))
+                    yield " ".join(sentence_chunk)
                     sentence_chunk = []
                     sentence_length = 0
                 sentence_chunk.append(sentence)
                 sentence_length += len(sentence) + 1
 
             if sentence_chunk:
-                chunks.append(" ".join(sentence_chunk))
+                yield " ".join(sentence_chunk)
             continue
 
         # Check if adding this paragraph would exceed the limit
         if current_length + para_length + 2 > max_length and current_chunk:
-            chunks.append("\n\n".join(current_chunk))
+            yield "\n\n".join(current_chunk)
             current_chunk = []
             current_length = 0
 
@@ -92,14 +194,32 @@ def split_into_chunks(text: str, max_length: int = None) -> List[str]:
 
     # Don't forget the last chunk
     if current_chunk:
-        chunks.append("\n\n".join(current_chunk))
+        yield "\n\n".join(current_chunk)
+
+
+def split_into_chunks(text: str, max_length: int = None) -> List[str]:
+    """
+    Split text into smaller chunks for translation.
+    Ensures clean boundaries at paragraph level when possible.
+    Preserves original formatting (paragraphs, dialogue, etc.)
+
+    Args:
+        text: Text to split
+        max_length: Maximum chunk length (uses config if not specified)
+
+    Returns:
+        List of text chunks
+    """
+    if max_length is None:
+        max_length = config.translation.max_prompt_length
 
-    result = chunks if chunks else [text]
+    result = list(iter_chunks(text, max_length)) or [text]
 
     # Debug output for chunking
+    paragraph_count = text.count("\n\n") + 1
     debug_print(f"[CHUNKING] Split text into {len(result)} chunks", "DEBUG", "TEXT")
     debug_print(
-        f"  Input: {len(text)} chars, {len(paragraphs)} paragraphs", "DEBUG", "TEXT"
+        f"  Input: {len(text)} chars, {paragraph_count} paragraphs", "DEBUG", "TEXT"
     )
     debug_print(f"  Max chunk size: {max_length} chars", "DEBUG", "TEXT")
     for i, chunk in enumerate(result):
@@ -131,83 +251,14 @@ def clean_translation_response(translation: str, previous_chunk: str = "") -> st
     debug_print(f"[CLEAN] Starting cleanup of {original_len} chars", "DEBUG", "TEXT")
 
     # ========== PHASE 1: Remove thinking/reasoning tags ==========
-    # Remove <think> tags and their content (common in reasoning models like DeepSeek)
-    translation = re.sub(
-        r"<think>.*?</think>", "", translation, flags=re.DOTALL | re.IGNORECASE
-    )
-    translation = re.sub(
-        r"<thinking>.*?</thinking>", "", translation, flags=re.DOTALL | re.IGNORECASE
-    )
-    translation = re.sub(
-        r"<reasoning>.*?</reasoning>", "", translation, flags=re.DOTALL | re.IGNORECASE
-    )
-    translation = re.sub(
-        r"<reflection>.*?</reflection>",
-        "",
-        translation,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
-
-    # Remove unclosed thinking tags (if model was cut off)
-    translation = re.sub(
-        r"<think>.*$", "", translation, flags=re.DOTALL | re.IGNORECASE
-    )
-    translation = re.sub(
-        r"<thinking>.*$", "", translation, flags=re.DOTALL | re.IGNORECASE
-    )
+    for pattern in _THINK_BLOCK_PATTERNS:
+        translation = pattern.sub("", translation)
 
     translation = translation.strip()
 
     # ========== PHASE 2: Remove instruction echoes ==========
-    # These are patterns where the model echoes parts of the prompt
-    unwanted_patterns = [
-        # English instruction echoes
-        r"IMPORTANT:\s*Return ONLY the translation[^\n]*\n*",
-        r"IMPORTANT:\s*Devolver SOLO la traducción[^\n]*\n*",
-        r"IMPORTANTE:\s*Devolver SOLO la traducción[^\n]*\n*",
-        r"IMPORTANTE:\s*Devuelve SOLO la traducción[^\n]*\n*",
-        r"IMPORTANTE:\s*Return ONLY[^\n]*\n*",
-        r"Return ONLY the translation[^\n]*\n*",
-        r"Devolver SOLO la traducción[^\n]*\n*",
-        r"No repita contenido previo[^\n]*\n*",
-        r"Do not repeat previous content[^\n]*\n*",
-        # Section headers from prompts
-        r"TEXT TO TRANSLATE:.*?\n+",
-        r"TEXTO A TRADUCIR:.*?\n+",
-        r"ORIGINAL TEXT:.*?\n+",
-        r"TEXTO ORIGINAL:.*?\n+",
-        r"CONTEXT \(previous translation[^\)]*\):.*?\n+",
-        r"CONTEXTO \(traducción anterior[^\)]*\):.*?\n+",
-        # Requirements section echoes
-        r"REQUIREMENTS:.*?(?=\n[A-Z]|\n\n|\Z)",
-        r"REQUISITOS:.*?(?=\n[A-Z]|\n\n|\Z)",
-        r"GENRE:.*?\n+",
-        r"GÉNERO:.*?\n+",
-        # Common LLM prefixes
-        r"^\s*Here is the translation:?\s*\n*",
-        r"^\s*Here\'s the translation:?\s*\n*",
-        r"^\s*Aquí está la traducción:?\s*\n*",
-        r"^\s*La traducción es:?\s*\n*",
-        r"^\s*Translation:?\s*\n*",
-        r"^\s*Traducción:?\s*\n*",
-        r"^\s*Translated text:?\s*\n*",
-        r"^\s*Texto traducido:?\s*\n*",
-        r"^\s*\*\*Translation:?\*\*\s*\n*",
-        r"^\s*\*\*Traducción:?\*\*\s*\n*",
-        # Markdown artifacts
-        r"^\s*---+\s*\n*",
-        r"^\s*\*\*\*+\s*\n*",
-        r"^\s*```[a-z]*\s*\n*",
-        r"\s*```\s*$",
-        # Notes/explanations wrapped in brackets (bounded, safe anywhere)
-        r"\n+\[Note:.*?\]",
-        r"\n+\[Nota:.*?\]",
-    ]
-
-    for pattern in unwanted_patterns:
-        translation = re.sub(
-            pattern, "", translation, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
-        )
+    for pattern in _UNWANTED_PATTERNS:
+        translation = pattern.sub("", translation)
 
     translation = translation.strip()
 
@@ -217,28 +268,17 @@ def clean_translation_response(translation: str, previous_chunk: str = "") -> st
     # text and looks like a short remark - never scan mid-text, since a
     # story can legitimately contain a paragraph starting with "Nota:"
     # (a letter, a message, etc.) and everything after it must be kept.
-    _note_re = re.compile(r"^\*{0,2}(?:Note|Nota)\s*:\s*.+$", re.IGNORECASE | re.DOTALL)
     for _sep in ("\n\n", "\n"):
         _parts = translation.split(_sep)
         if len(_parts) > 1:
             _last = _parts[-1].strip()
-            if _note_re.match(_last) and len(_last) < 300:
+            if _TRAILING_NOTE_RE.match(_last) and len(_last) < 300:
                 translation = _sep.join(_parts[:-1]).strip()
                 break
 
     # ========== PHASE 3: Remove prompt context that leaked ==========
-    # Sometimes the model includes the "previous translation for continuity" context
-    context_markers = [
-        r"^.*?(?:for continuity|para continuidad):?\s*\n+",
-        r"^.*?(?:previous translation|traducción anterior):?\s*\n+",
-        r"INICIOS?\s*\n+",  # Sometimes models output this marker
-        r"BEGINNINGS?\s*\n+",
-    ]
-
-    for pattern in context_markers:
-        translation = re.sub(
-            pattern, "", translation, flags=re.IGNORECASE | re.MULTILINE
-        )
+    for pattern in _CONTEXT_MARKER_PATTERNS:
+        translation = pattern.sub("", translation)
 
     translation = translation.strip()
 
@@ -254,24 +294,7 @@ def clean_translation_response(translation: str, previous_chunk: str = "") -> st
 
     # ========== PHASE 5: Remove repetition from previous chunk ==========
     if previous_chunk and len(previous_chunk) > 50:
-        prev_lines = previous_chunk.strip().split("\n")
-
-        # Check if translation starts with content from previous chunk
-        for i in range(min(5, len(prev_lines))):
-            check_text = "\n".join(prev_lines[-(i + 1) :]).strip()
-            if len(check_text) > 50 and translation.startswith(check_text):
-                translation = translation[len(check_text) :].strip()
-                break
-
-        # Check for partial sentence duplicates
-        if len(prev_lines) > 0:
-            last_prev_line = prev_lines[-1].strip()
-            if len(last_prev_line) > 30:
-                for check_len in range(len(last_prev_line), 30, -10):
-                    check_segment = last_prev_line[-check_len:]
-                    if translation.startswith(check_segment):
-                        translation = translation[len(check_segment) :].strip()
-                        break
+        translation = _strip_previous_overlap(translation, previous_chunk)
 
     final_len = len(translation.strip())
     if original_len != final_len:
@@ -286,6 +309,46 @@ def clean_translation_response(translation: str, previous_chunk: str = "") -> st
     return translation.strip()
 
 
+def _strip_previous_overlap(translation: str, previous_chunk: str) -> str:
+    """
+    Remove text at the start of `translation` that repeats the end of the
+    previous chunk.
+
+    Args:
+        translation: Translation being cleaned
+        previous_chunk: Previous chunk's translation
+
+    Returns:
+        Translation without the repeated lead-in
+    """
+    prev_lines = previous_chunk.strip().split("\n")
+
+    # Check if translation starts with content from previous chunk
+    for i in range(min(5, len(prev_lines))):
+        check_text = "\n".join(prev_lines[-(i + 1) :]).strip()
+        if len(check_text) > 50 and translation.startswith(check_text):
+            translation = translation[len(check_text) :].strip()
+            break
+
+    # Check for partial sentence duplicates: the longest suffix of the last
+    # line (lengths stepping down by 10, all longer than 30) that the
+    # translation starts with. Every such suffix starts at an offset that is
+    # a multiple of 10 and begins with the translation's first 31 chars, so
+    # a single find() scan replaces slicing and testing each candidate.
+    last_prev_line = prev_lines[-1].strip()
+    line_len = len(last_prev_line)
+    if line_len > 30 and len(translation) > 30:
+        head = translation[:31]
+        pos = last_prev_line.find(head)
+        while pos != -1 and line_len - pos > 30:
+            if pos % 10 == 0 and translation.startswith(last_prev_line[pos:]):
+                translation = translation[line_len - pos :].strip()
+                break
+            pos = last_prev_line.find(head, pos + 1)
+
+    return translation
+
+
 def clean_for_epub(text: str) -> str:
     """
     Clean text specifically for EPUB output.
@@ -301,35 +364,22 @@ def clean_for_epub(text: str) -> str:
         return ""
 
     # Remove null characters and other control characters (except newlines/tabs)
-    text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
+    text = _EPUB_CONTROL_CHARS_RE.sub("", text)
 
     # Remove any remaining thinking tags
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(
-        r"<thinking>.*?</thinking>", "", text, flags=re.DOTALL | re.IGNORECASE
-    )
-    text = re.sub(r"<think>.*$", "", text, flags=re.DOTALL | re.IGNORECASE)
+    for pattern in _EPUB_THINK_PATTERNS:
+        text = pattern.sub("", text)
 
     # Remove instruction artifacts
-    instruction_patterns = [
-        r"IMPORTANT:.*?(?:\n|$)",
-        r"IMPORTANTE:.*?(?:\n|$)",
-        r"REQUIREMENTS:.*?(?:\n\n|\Z)",
-        r"REQUISITOS:.*?(?:\n\n|\Z)",
-        r"\[⚠️[^\]]*\]",
-        r"Note:.*?(?:\n|$)",
-        r"Nota:.*?(?:\n|$)",
-    ]
-
-    for pattern in instruction_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.MULTILINE)
+    for pattern in _EPUB_INSTRUCTION_PATTERNS:
+        text = pattern.sub("", text)
 
     # Escape special XML characters (for XHTML compatibility)
     # But preserve already-escaped entities
-    text = re.sub(r"&(?!(amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)", "&amp;", text)
+    text = _UNESCAPED_AMPERSAND_RE.sub("&amp;", text)
 
     # Ensure proper paragraph separation
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXCESS_BLANK_LINES_RE.sub("\n\n", text)
 
     return text.strip()
 
@@ -380,10 +430,9 @@ def extract_proper_nouns(text: str) -> List[str]:
     Returns:
         List of unique proper nouns
     """
-    # Match capitalized words that are not at sentence start
-    pattern = r"(?<!^)(?<![.!?]\s)\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b"
-    nouns = re.findall(pattern, text, re.MULTILINE)
-    return list(set(nouns))
+    # Match capitalized words that are not at sentence start; dedupe keeping
+    # first-seen order
+    return list(dict.fromkeys(PROPER_NOUN_RE.findall(text)))
 
 
 def count_words(text: str) -> int:
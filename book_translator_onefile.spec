@@ -74,6 +74,7 @@ a = Analysis(
         'book_translator.utils.text_processing',
         'book_translator.utils.validators',
         'book_translator.utils.logging',
+        'book_translator.utils.serialization',
         # Flask and dependencies
         'flask',
         'flask.app',
@@ -9,7 +9,7 @@ import json
 import os
 import sys
 import tempfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -83,6 +83,45 @@ class TestTranslationsEndpoint:
         assert "translations" in data
         assert isinstance(data["translations"], list)
 
+    def test_translations_list_streams_rows(self, client):
+        from book_translator.database.repositories import get_translation_repository
+
+        repo = get_translation_repository()
+        ids = [
+            repo.create(
+                original_filename=f"book{i}.txt",
+                source_language="en",
+                target_language="es",
+                model_name="test-model",
+                original_text="Señor " * 3,
+                file_size=21,
+            )
+            for i in range(2)
+        ]
+        repo.mark_failed(ids[0], "boom")
+
+        response = client.get("/api/translations?status=failed&limit=1000")
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        rows = json.loads(response.data)["translations"]
+        listed = [row["id"] for row in rows]
+        assert ids[0] in listed
+        assert ids[1] not in listed
+        assert all(row["status"] == "failed" for row in rows)
+
+    def test_list_translations_rejects_bad_paging(self, client):
+        response = client.get("/api/translations?limit=abc")
+        assert response.status_code == 400
+        assert "error" in json.loads(response.data)
+
+        response = client.get("/api/translations?offset=-1")
+        assert response.status_code == 400
+
+    def test_list_translations_empty_page(self, client):
+        response = client.get("/api/translations?offset=1000000")
+        assert response.status_code == 200
+        assert json.loads(response.data) == {"translations": []}
+
     def test_translations_stats(self, client):
         response = client.get("/api/translations/stats")
         assert response.status_code == 200
@@ -115,6 +154,117 @@ class TestTranslationsEndpoint:
             == "Preserve the noir tone."
         )
 
+    def test_failure_is_not_overwritten_by_pending_progress(self, client):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from book_translator.api import routes
+        from book_translator.database.repositories import get_translation_repository
+        from book_translator.models.translation import TranslationProgress
+
+        repo = get_translation_repository()
+        translation_id = repo.create(
+            original_filename="sample.txt",
+            source_language="en",
+            target_language="es",
+            model_name="test-model",
+            original_text="Hello world",
+            file_size=11,
+        )
+
+        def translate_text(*args, **kwargs):
+            yield TranslationProgress(progress=50, stage="translating")
+            raise RuntimeError("model went away")
+
+        real_save = routes._save_progress
+
+        def slow_save(*args):
+            # Land the progress write after the failure has been handled
+            time.sleep(0.2)
+            real_save(*args)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch.object(routes, "BookTranslator") as translator_cls, patch.object(
+            routes, "_save_progress", slow_save
+        ), patch.object(routes, "get_translation_executor", return_value=executor):
+            translator_cls.return_value.translate_text.side_effect = translate_text
+            routes._submit_translation_job(
+                translation_id, "sample.txt", "Hello world", "en", "es", "test"
+            )
+            executor.shutdown(wait=True)
+        routes.get_progress_writer().submit(lambda: None).result()
+
+        translation = repo.get_by_id(translation_id)
+        assert translation["status"] == "failed"
+        assert translation["error_message"] == "model went away"
+
+    def test_status_checked_between_text_flushes(self, client):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from book_translator.api import routes
+        from book_translator.config import config
+        from book_translator.database.repositories import get_translation_repository
+        from book_translator.models.translation import TranslationProgress
+
+        repo = get_translation_repository()
+        translation_id = repo.create(
+            original_filename="sample.txt",
+            source_language="en",
+            target_language="es",
+            model_name="test-model",
+            original_text="Hello world",
+            file_size=11,
+        )
+        resumed_after_cancel = []
+
+        def translate_text(*args, **kwargs):
+            yield TranslationProgress(progress=10, stage="translating")
+            yield TranslationProgress(progress=40, stage="translating")
+            routes.get_progress_writer().submit(lambda: None).result()
+            # Cancelled from another worker: only the database knows
+            repo.mark_cancelled(translation_id)
+            yield TranslationProgress(progress=70, stage="translating")
+            resumed_after_cancel.append(True)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch.object(routes, "BookTranslator") as translator_cls, patch.object(
+            routes, "get_translation_executor", return_value=executor
+        ), patch.object(config.translation, "progress_flush_interval", 3600):
+            translator_cls.return_value.translate_text.side_effect = translate_text
+            routes._submit_translation_job(
+                translation_id, "sample.txt", "Hello world", "en", "es", "test"
+            )
+            executor.shutdown(wait=True)
+        routes.get_progress_writer().submit(lambda: None).result()
+
+        translation = repo.get_by_id(translation_id)
+        assert resumed_after_cancel == []
+        assert translation["status"] == "cancelled"
+        assert translation["progress"] == 40
+
+    def test_stream_sends_compact_utf8_events(self, client):
+        from book_translator.database.repositories import get_translation_repository
+
+        repo = get_translation_repository()
+        translation_id = repo.create(
+            original_filename="sample.txt",
+            source_language="en",
+            target_language="es",
+            model_name="test-model",
+            original_text="Good morning",
+            file_size=12,
+        )
+        repo.mark_completed(translation_id, "Buenos días", "sample_es.txt")
+
+        response = client.get(f"/api/translate/{translation_id}/stream")
+        assert response.status_code == 200
+        assert response.headers["X-Accel-Buffering"] == "no"
+        body = response.get_data()
+        assert body.startswith(b'data: {"id":')
+        assert "Buenos días".encode("utf-8") in body
+        event = json.loads(body.decode("utf-8")[len("data: ") :])
+        assert event["status"] == "completed"
+
 
 class TestTranslateEndpoint:
     """Test translation upload endpoint."""
@@ -184,6 +334,25 @@ class TestTranslateEndpoint:
             'Translate "Order" as "Orden". Keep a solemn tone.'
         )
 
+    @patch("book_translator.api.routes._submit_translation_job")
+    def test_upload_is_decoded_without_touching_disk(self, mock_submit, client):
+        from book_translator.config import config
+
+        upload_folder = config.paths.upload_folder
+        before = set(upload_folder.iterdir())
+        data = {
+            "file": (io.BytesIO("Canci\u00f3n".encode("latin-1")), "song.txt"),
+            "source_lang": "es",
+            "target_lang": "en",
+            "model": "test-model",
+        }
+        response = client.post(
+            "/api/translate", data=data, content_type="multipart/form-data"
+        )
+        assert response.status_code == 200
+        assert mock_submit.call_args.kwargs["content"] == "Canci\u00f3n"
+        assert set(upload_folder.iterdir()) == before
+
 
 class TestLogsEndpoint:
     """Test logs endpoint."""
@@ -214,6 +383,28 @@ class TestMetricsEndpoint:
         assert "failed_translations" in data["translation_metrics"]
         assert "success_rate" in data["translation_metrics"]
 
+    def test_disk_usage_cached_per_path_and_failures_retried(self, tmp_path):
+        from book_translator.api import routes
+
+        good, bad = str(tmp_path), str(tmp_path / "missing")
+
+        def fake_disk_usage(path):
+            if path == bad:
+                raise OSError(path)
+            return MagicMock(percent=42.0)
+
+        routes._disk_usage_samples.clear()
+        with patch.object(
+            routes.psutil, "disk_usage", side_effect=fake_disk_usage
+        ) as disk_usage:
+            assert routes._get_disk_percent(good) == 42.0
+            assert routes._get_disk_percent(good) == 42.0
+            assert routes._get_disk_percent(bad) is None
+            assert routes._get_disk_percent(bad) is None
+
+        assert [c.args[0] for c in disk_usage.call_args_list] == [good, bad, bad]
+        routes._disk_usage_samples.clear()
+
 
 class TestCacheEndpoints:
     """Test cache endpoints."""
@@ -248,6 +439,56 @@ class TestExportEndpoints:
         assert response.status_code == 200
         assert response.content_type == "application/epub+zip"
 
+    def test_export_epub_is_a_valid_package(self, client):
+        import zipfile
+
+        response = client.post(
+            "/api/export/epub", json={"text": "Uno.\n\nDos.", "title": "Libro & Co"}
+        )
+        with zipfile.ZipFile(io.BytesIO(response.data)) as epub:
+            first = epub.infolist()[0]
+            assert first.filename == "mimetype"
+            assert first.compress_type == zipfile.ZIP_STORED
+            assert epub.testzip() is None
+            chapter = epub.read("OEBPS/chapter1.xhtml").decode("utf-8")
+        assert "<p>Uno.</p>" in chapter
+        assert "<title>Libro &amp; Co</title>" in chapter
+
+
+class TestDownloadEndpoint:
+    """Test translated file downloads."""
+
+    def test_download_supports_conditional_requests(self, client):
+        from book_translator.config import config
+        from book_translator.database.repositories import get_translation_repository
+
+        repo = get_translation_repository()
+        translation_id = repo.create(
+            original_filename="sample.txt",
+            source_language="en",
+            target_language="es",
+            model_name="test-model",
+            original_text="Hello",
+            file_size=5,
+        )
+        filename = f"sample_es_{translation_id}.txt"
+        output_path = config.paths.translations_folder / filename
+        output_path.write_text("Hola", encoding="utf-8")
+        repo.mark_completed(translation_id, "Hola", filename)
+
+        response = client.get(f"/api/download/{translation_id}")
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        revalidated = client.get(
+            f"/api/download/{translation_id}",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.data == b""
+        output_path.unlink()
+
 
 class TestLanguagesEndpoint:
     """Test languages endpoint."""
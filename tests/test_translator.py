@@ -58,6 +58,20 @@ class TestDetectLanguageMarkers:
         count, markers, ratio = detect_language_markers(text, "es")
         assert count > 0
 
+    def test_word_markers_follow_substring_count_semantics(self):
+        text = "The the cat sat in the hat, and the dog of the house"
+        count, markers, _ = detect_language_markers(text, "en")
+        # The repeated "the" shares a space with the first match and is not
+        # counted again; multi-word markers overlap single-word ones
+        assert count == 9
+        assert markers == ["the", "in", "and", "of the", "in the", "and the"]
+
+    def test_elided_and_multi_word_markers(self):
+        text = "L'homme et l'enfant, il y a du pain"
+        count, markers, _ = detect_language_markers(text, "fr")
+        assert count == 7
+        assert set(markers) == {"du", "l'", "il", "a", "et", "il y a"}
+
     def test_detect_no_markers(self):
         text = "12345 67890"  # Numbers only
         count, markers, ratio = detect_language_markers(text, "en")